@@ -1,12 +1,14 @@
 """API route definitions for ArchDrift."""
 
 import asyncio
+import functools
 import hashlib
 import json
 import os
 import re
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +22,7 @@ from services.drift_store import get_drift_by_id, list_drifts, set_latest_drifts
 from utils.git_parser import clone_or_open_repo, list_commits
 from utils.architecture_config import load_architecture_config, _get_default_config_dir
 from utils.baseline_store import load_baseline, get_active_exceptions
+from utils.file_hash import file_sha256
 
 router = APIRouter()
 
@@ -265,6 +268,28 @@ async def analyze_local_repo(payload: AnalyzeLocalRepoRequest) -> list[Drift]:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _onboarding_dir() -> Path:
+    """Get the directory holding onboarding configs and snapshots.
+
+    Returns:
+        ARCHDRIFT_ONBOARDING_DIR if set, otherwise backend/.onboarding.
+    """
+    override = os.environ.get("ARCHDRIFT_ONBOARDING_DIR")
+    if override:
+        return Path(override)
+    return Path(__file__).parent.parent / ".onboarding"
+
+
+@functools.lru_cache(maxsize=1024)
+def _onboarding_repo_id(repo_path: str) -> str:
+    """Derive the 12-hex repo_id keying onboarding configs and snapshots.
+
+    Cached on the repo_path string, since the same repositories are looked
+    up repeatedly across onboarding requests.
+    """
+    return hashlib.sha256(repo_path.encode("utf-8")).hexdigest()[:12]
+
+
 def _analyze_local_repo_worker(
     repo_path: str,
     max_commits: int,
@@ -887,11 +912,11 @@ def _apply_module_map_worker(repo_path: str, module_map: dict, config_label: str
     if not isinstance(module_map, dict):
         raise ValueError("module_map must be an object")
     
-    # Compute backend_dir
-    backend_dir = Path(__file__).parent.parent
+    # Compute onboarding state directory
+    onboarding_dir = _onboarding_dir()
     
     # Compute repo_id
-    repo_id = hashlib.sha256(str(repo_path).encode("utf-8")).hexdigest()[:12]
+    repo_id = _onboarding_repo_id(str(repo_path))
     
     # Sanitize config_label
     if config_label:
@@ -912,7 +937,7 @@ def _apply_module_map_worker(repo_path: str, module_map: dict, config_label: str
         label_dir = "default"
     
     # Determine config_dir
-    base_dir = backend_dir / ".onboarding" / "configs" / repo_id
+    base_dir = onboarding_dir / "configs" / repo_id
     config_dir = base_dir / label_dir
     
     # Create config_dir
@@ -958,9 +983,7 @@ def _apply_module_map_worker(repo_path: str, module_map: dict, config_label: str
             os.fsync(f.fileno())
     
     # Compute SHA256 of module_map.json file bytes
-    with open(module_map_path, "rb") as f:
-        file_bytes = f.read()
-    module_map_sha256 = hashlib.sha256(file_bytes).hexdigest()
+    module_map_sha256 = file_sha256(module_map_path)
     
     # Build notes
     notes = ["Module map saved server-side (repo not modified)."]
@@ -982,6 +1005,7 @@ async def onboarding_apply_module_map(payload: ApplyModuleMapRequest) -> dict:
     Apply a module_map.json configuration server-side without modifying the repo.
 
     This endpoint persists a module_map.json file in backend/.onboarding/configs/
+    (or ARCHDRIFT_ONBOARDING_DIR/configs/ when that variable is set)
     and returns the config_dir path that can be used with baseline endpoints.
 
     Request body:
@@ -1049,11 +1073,11 @@ def _create_arch_snapshot_worker(
     if not module_map_path.exists():
         raise ValueError(f"module_map.json not found in config_dir: {config_dir_obj}")
     
-    # Compute backend_dir
-    backend_dir = Path(__file__).parent.parent
+    # Compute onboarding state directory
+    onboarding_dir = _onboarding_dir()
     
     # Compute repo_id
-    repo_id = hashlib.sha256(str(repo_path).encode("utf-8")).hexdigest()[:12]
+    repo_id = _onboarding_repo_id(str(repo_path))
     
     # Read module_map.json bytes and compute SHA256
     module_map_bytes = module_map_path.read_bytes()
@@ -1081,7 +1105,7 @@ def _create_arch_snapshot_worker(
     snapshot_id = hashlib.sha256(snapshot_input.encode("utf-8")).hexdigest()[:16]
     
     # Create snapshot directory
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
     snapshot_dir = snapshots_root / snapshot_id
     snapshot_dir.mkdir(parents=True, exist_ok=True)
     
@@ -1212,14 +1236,14 @@ def _list_arch_snapshots_worker(repo_path: str, limit: int) -> dict:
     if limit < 1 or limit > 100:
         raise ValueError(f"Invalid limit: {limit}. Must be 1..100.")
     
-    # Compute backend_dir
-    backend_dir = Path(__file__).parent.parent
+    # Compute onboarding state directory
+    onboarding_dir = _onboarding_dir()
     
     # Compute repo_id
-    repo_id = hashlib.sha256(str(repo_path).encode("utf-8")).hexdigest()[:12]
+    repo_id = _onboarding_repo_id(str(repo_path))
     
     # Compute snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
     
     # If snapshots_root doesn't exist, return empty list
     if not snapshots_root.exists():
@@ -1229,24 +1253,17 @@ def _list_arch_snapshots_worker(repo_path: str, limit: int) -> dict:
             "snapshots": [],
         }
     
-    # Collect snapshots
+    # Collect snapshots (scandir entries carry their file type, saving a stat each)
     snapshots = []
-    for snapshot_dir in snapshots_root.iterdir():
-        # Only process directories
-        if not snapshot_dir.is_dir():
-            continue
-        
-        metadata_path = snapshot_dir / "metadata.json"
-        if not metadata_path.exists():
-            # Skip if metadata.json doesn't exist (don't error)
-            continue
-        
+    with os.scandir(snapshots_root) as entries:
+        snapshot_entries = [entry for entry in entries if entry.is_dir()]
+    for snapshot_dir in snapshot_entries:
         try:
             # Load metadata.json
-            with open(metadata_path, "r", encoding="utf-8") as f:
+            with open(os.path.join(snapshot_dir.path, "metadata.json"), "r", encoding="utf-8") as f:
                 metadata = json.load(f)
         except Exception:
-            # Skip if metadata.json can't be loaded (don't error)
+            # Skip if metadata.json is missing or can't be loaded (don't error)
             continue
         
         # Build snapshot entry
@@ -1262,14 +1279,9 @@ def _list_arch_snapshots_worker(repo_path: str, limit: int) -> dict:
         }
         snapshots.append(snapshot_entry)
     
-    # Sort snapshots descending by created_at_utc
-    # Treat missing/empty created_at_utc as lowest (appear last)
-    def sort_key(snapshot):
-        created_at = snapshot.get("created_at_utc") or ""
-        # Return tuple: (has_value, value) so empty strings sort last
-        return (bool(created_at), created_at)
-    
-    snapshots.sort(key=sort_key, reverse=True)
+    # Sort snapshots descending by created_at_utc (ISO-8601 string compare)
+    # Missing created_at_utc is stored as "", which sorts lowest (appears last)
+    snapshots.sort(key=itemgetter("created_at_utc"), reverse=True)
     
     # Apply limit
     snapshots = snapshots[:limit]
@@ -1345,14 +1357,14 @@ def _resolve_effective_config_worker(repo_path: str, snapshot_id: str | None) ->
         if not re.match(r'^[a-f0-9]{16}$', snapshot_id):
             raise ValueError(f"Invalid snapshot_id: {snapshot_id}. Must be 16 lowercase hex chars.")
     
-    # Compute backend_dir
-    backend_dir = Path(__file__).parent.parent
+    # Compute onboarding state directory
+    onboarding_dir = _onboarding_dir()
     
     # Compute repo_id
-    repo_id = hashlib.sha256(str(repo_path).encode("utf-8")).hexdigest()[:12]
+    repo_id = _onboarding_repo_id(str(repo_path))
     
     # Compute snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
     
     # If snapshots_root doesn't exist, raise error
     if not snapshots_root.exists():
@@ -1368,20 +1380,17 @@ def _resolve_effective_config_worker(repo_path: str, snapshot_id: str | None) ->
     else:
         # Find latest snapshot by reading metadata.json
         candidates = []
-        for child_dir in snapshots_root.iterdir():
-            if not child_dir.is_dir():
-                continue
-            metadata_path = child_dir / "metadata.json"
-            if not metadata_path.exists():
-                continue
+        with os.scandir(snapshots_root) as entries:
+            child_entries = [entry for entry in entries if entry.is_dir()]
+        for child_entry in child_entries:
             try:
-                with open(metadata_path, "r", encoding="utf-8") as f:
+                with open(os.path.join(child_entry.path, "metadata.json"), "r", encoding="utf-8") as f:
                     metadata = json.load(f)
                 created_at_utc = metadata.get("created_at_utc", "")
                 if created_at_utc:
-                    candidates.append((created_at_utc, child_dir))
+                    candidates.append((created_at_utc, Path(child_entry.path)))
             except Exception:
-                # Skip if metadata.json can't be loaded
+                # Skip if metadata.json is missing or can't be loaded
                 continue
         
         if not candidates:
@@ -7,9 +7,10 @@ must be derived here from commit data (Mirror + Mentor), not in the frontend.
 Currently uses simple keyword matching; will be enhanced with AI analysis in future versions.
 """
 
-import hashlib
 import os
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -25,19 +26,22 @@ from utils.git_commit_graph import build_commit_delta, Limits as CommitLimits
 from utils.dependency_graph import build_dependency_graph  # imported for test monkeypatches
 from services.baseline_service import baseline_dir_for_repo
 from utils.baseline_store import load_baseline, get_active_exceptions
+from utils.file_hash import file_sha256
 
 logger = logging.getLogger(__name__)
 
+# Deterministic evidence_preview order; every preview item carries all of these keys
+_EVIDENCE_PREVIEW_SORT_KEY = itemgetter("rule", "from_module", "to_module", "src_file", "import_ref")
+
 
 def _hash_file(path: Path) -> str | None:
     """Compute SHA-256 hash of a file; return None if missing or unreadable."""
     if not path.exists() or not path.is_file():
         return None
     try:
-        data = path.read_bytes()
+        return file_sha256(path)
     except Exception:
         return None
-    return hashlib.sha256(data).hexdigest()
 
 
 def _run_conformance_pipeline(repo_root: Path) -> dict:
@@ -184,6 +188,61 @@ def resolve_classifier_mode(override: str | None) -> str:
     return get_drift_classifier_mode()
 
 
+def get_drift_max_workers() -> int:
+    """Get the worker count for per-commit delta extraction from DRIFT_MAX_WORKERS.
+
+    Returns:
+        A positive worker count. Defaults to the CPU count if unset or invalid.
+    """
+    default = os.cpu_count() or 1
+    raw = os.environ.get("DRIFT_MAX_WORKERS", "").strip()
+    if not raw:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(f"Invalid DRIFT_MAX_WORKERS value '{raw}'. Falling back to {default}.")
+        return default
+    return value
+
+
+def _submit_commit_deltas(
+    executor: ThreadPoolExecutor,
+    repo_root_path: str,
+    commit_hashes: list[str],
+    config: Any,
+    commit_limits: CommitLimits,
+) -> dict[str, Future]:
+    """Start build_commit_delta for each commit on the given thread pool.
+
+    Each delta opens its own Repo, so commits are extracted independently;
+    callers take results (or exceptions) from the futures in their own order
+    and own the executor's shutdown.
+
+    Args:
+        executor: Thread pool to run the deltas on.
+        repo_root_path: Path to the repository root.
+        commit_hashes: Commits to extract deltas for.
+        config: Architecture configuration.
+        commit_limits: Per-commit extraction limits.
+
+    Returns:
+        Mapping of commit hash to the future of its delta.
+    """
+    return {
+        commit_hash: executor.submit(
+            build_commit_delta,
+            repo_path=repo_root_path,
+            commit_sha=commit_hash,
+            config=config,
+            limits=commit_limits,
+        )
+        for commit_hash in commit_hashes
+    }
+
+
 # Keywords that suggest positive architectural changes
 POSITIVE_KEYWORDS = [
     "refactor",
@@ -461,60 +520,68 @@ def commits_to_drifts(
     
     # Use at most max_drifts commits (most recent first)
     selected_commits = commits[:max_drifts]
-    
-    for commit in selected_commits:
-        commit_message_full = commit.get("message", "")
-        commit_message_lower = commit_message_full.lower()
-        commit_hash = commit.get("hash", "")
-        commit_date = commit.get("date", "")
-        files_changed = commit.get("files_changed", [])
-        
-        # Detect teams from file paths
-        teams = detect_teams_from_files(files_changed)
+
+    # Detect drift type categories
+    drift_type_categories = [
+        detect_drift_type(commit.get("message", ""), commit.get("files_changed", []))
+        for commit in selected_commits
+    ]
+
+    # Start commit deltas for architecture commits up front so they are
+    # extracted concurrently; each is consumed in commit order below
+    commit_delta_futures: dict[str, Future] = {}
+    delta_executor: ThreadPoolExecutor | None = None
+    if resolved_mode == "conformance" and repo_root_path and config and baseline_data:
+        is_ready_initial, _ = assess_conformance_readiness(
+            baseline_summary=baseline_data.get("baseline_summary"),
+            baseline_edges_count=baseline_data.get("baseline_edges_count"),
+            graph_stats=None,
+        )
+        architecture_hashes = [
+            commit.get("hash", "")
+            for commit, category in zip(selected_commits, drift_type_categories)
+            if category == "architecture"
+        ]
+        if is_ready_initial and architecture_hashes:
+            delta_executor = ThreadPoolExecutor(
+                max_workers=min(get_drift_max_workers(), len(architecture_hashes))
+            )
+            commit_delta_futures = _submit_commit_deltas(
+                delta_executor,
+                repo_root_path,
+                architecture_hashes,
+                config,
+                commit_limits,
+            )
+
+    try:
+        for commit, drift_type_category in zip(selected_commits, drift_type_categories):
+            commit_message_full = commit.get("message", "")
+            commit_message_lower = commit_message_full.lower()
+            commit_hash = commit.get("hash", "")
+            commit_date = commit.get("date", "")
+            files_changed = commit.get("files_changed", [])
         
-        # Detect drift type category
-        drift_type_category = detect_drift_type(commit_message_full, files_changed)
+            # Detect teams from file paths
+            teams = detect_teams_from_files(files_changed)
         
-        # Determine drift type (positive/negative) based on classifier mode
-        classification = None
-        reason_codes: list[str] = []
-        conformance_summary: dict = {}
-        conformance_result: dict = {}
-        evidence_preview: list[dict] = []
-        graph_stats: dict = {}
-        text_info_override = None
+            # Determine drift type (positive/negative) based on classifier mode
+            classification = None
+            reason_codes: list[str] = []
+            conformance_summary: dict = {}
+            conformance_result: dict = {}
+            evidence_preview: list[dict] = []
+            graph_stats: dict = {}
+            text_info_override = None
         
-        if resolved_mode == "conformance" and drift_type_category == "architecture":
-            prereq_missing = not (repo_root_path and config and baseline_data)
-            baseline_summary = baseline_data.get("baseline_summary") if baseline_data else None
-            baseline_edges_count = baseline_data.get("baseline_edges_count") if baseline_data else None
-
-            if prereq_missing:
-                classification = "unknown"
-                reason_codes = sorted(set(reason_codes + ["BASELINE_MISSING"]))
-                sentiment = "unknown"
-                text_info_override = {
-                    "title": commit_message_full[:100],
-                    "summary": "Conformance classification is Unknown because the baseline is not ready. Generate + approve a baseline and ensure module mapping covers source paths.",
-                    "functionality": "",
-                    "disadvantage": None,
-                    "rootCause": None,
-                    "recommendedActions": [
-                        "Generate and approve a baseline.",
-                        "Ensure module_map.json covers source paths.",
-                        "Re-run analysis in conformance mode.",
-                    ],
-                }
-            else:
-                # Early readiness check before doing heavy work
-                is_ready_initial, readiness_reasons_initial = assess_conformance_readiness(
-                    baseline_summary=baseline_summary,
-                    baseline_edges_count=baseline_edges_count,
-                    graph_stats=None,
-                )
-                if not is_ready_initial:
+            if resolved_mode == "conformance" and drift_type_category == "architecture":
+                prereq_missing = not (repo_root_path and config and baseline_data)
+                baseline_summary = baseline_data.get("baseline_summary") if baseline_data else None
+                baseline_edges_count = baseline_data.get("baseline_edges_count") if baseline_data else None
+
+                if prereq_missing:
                     classification = "unknown"
-                    reason_codes = sorted(set(reason_codes + readiness_reasons_initial))
+                    reason_codes = sorted(set(reason_codes + ["BASELINE_MISSING"]))
                     sentiment = "unknown"
                     text_info_override = {
                         "title": commit_message_full[:100],
@@ -529,319 +596,333 @@ def commits_to_drifts(
                         ],
                     }
                 else:
-                    # Per-commit delta via MT_17
-                    try:
-                        commit_delta = build_commit_delta(
-                            repo_path=repo_root_path,
-                            commit_sha=commit_hash,
-                            config=config,
-                            limits=commit_limits,
-                        )
-                    except Exception as exc:
-                        logger.warning("Conformance commit delta failed for %s: %s", commit_hash, exc)
-                        commit_delta = {
-                            "edges_added": [],
-                            "edges_removed": [],
-                            "edges_added_count": 0,
-                            "edges_removed_count": 0,
-                            "evidence": [],
-                            "truncated": False,
-                            "stats": {},
-                        }
-                        reason_codes = ["compare_failed"]
+                    # Early readiness check before doing heavy work
+                    is_ready_initial, readiness_reasons_initial = assess_conformance_readiness(
+                        baseline_summary=baseline_summary,
+                        baseline_edges_count=baseline_edges_count,
+                        graph_stats=None,
+                    )
+                    if not is_ready_initial:
                         classification = "unknown"
-                        conformance_summary = {
-                            "edges_added_count": 0,
-                            "edges_removed_count": 0,
-                            "forbidden_edges_added_count": 0,
-                            "forbidden_edges_removed_count": 0,
-                            "cycles_added_count": 0,
-                            "cycles_removed_count": 0,
+                        reason_codes = sorted(set(reason_codes + readiness_reasons_initial))
+                        sentiment = "unknown"
+                        text_info_override = {
+                            "title": commit_message_full[:100],
+                            "summary": "Conformance classification is Unknown because the baseline is not ready. Generate + approve a baseline and ensure module mapping covers source paths.",
+                            "functionality": "",
+                            "disadvantage": None,
+                            "rootCause": None,
+                            "recommendedActions": [
+                                "Generate and approve a baseline.",
+                                "Ensure module_map.json covers source paths.",
+                                "Re-run analysis in conformance mode.",
+                            ],
                         }
                     else:
-                        # Build a compare-like structure from delta
-                        compare_like = {
-                            "edges_added": commit_delta.get("edges_added", []),
-                            "edges_removed": commit_delta.get("edges_removed", []),
-                            "counts": {
-                                "divergence": commit_delta.get("edges_added_count", 0),
-                                "absence": commit_delta.get("edges_removed_count", 0),
+                        # Per-commit delta via MT_17
+                        try:
+                            commit_delta = commit_delta_futures[commit_hash].result()
+                        except Exception as exc:
+                            logger.warning("Conformance commit delta failed for %s: %s", commit_hash, exc)
+                            commit_delta = {
+                                "edges_added": [],
+                                "edges_removed": [],
+                                "edges_added_count": 0,
+                                "edges_removed_count": 0,
+                                "evidence": [],
+                                "truncated": False,
+                                "stats": {},
+                            }
+                            reason_codes = ["compare_failed"]
+                            classification = "unknown"
+                            conformance_summary = {
+                                "edges_added_count": 0,
+                                "edges_removed_count": 0,
+                                "forbidden_edges_added_count": 0,
+                                "forbidden_edges_removed_count": 0,
+                                "cycles_added_count": 0,
+                                "cycles_removed_count": 0,
+                            }
+                        else:
+                            # Build a compare-like structure from delta
+                            compare_like = {
+                                "edges_added": commit_delta.get("edges_added", []),
+                                "edges_removed": commit_delta.get("edges_removed", []),
+                                "counts": {
+                                    "divergence": commit_delta.get("edges_added_count", 0),
+                                    "absence": commit_delta.get("edges_removed_count", 0),
+                                    "edges_added_count": commit_delta.get("edges_added_count", 0),
+                                    "edges_removed_count": commit_delta.get("edges_removed_count", 0),
+                                },
+                            }
+                            # Rule check
+                            rules_result = check_rules(compare_like, config, baseline_data.get("active_exceptions", []))
+                            # Cycles: per MT_18 safe rule, keep zero
+                            cycles_result = {
+                                "counts": {"cycles_added_count": 0, "cycles_removed_count": 0},
+                                "cycles_added": [],
+                                "cycles_removed": [],
+                            }
+                            # Classify
+                            analysis = {
+                                "compare": compare_like,
+                                "rules": rules_result,
+                                "cycles": cycles_result,
+                            }
+                            classification_result = classify_drift(analysis)
+                            classification = classification_result.get("classification", "unknown")
+                            reason_codes = classification_result.get("reason_codes", [])
+                            summary = classification_result.get("summary", {})
+                            conformance_summary = {
                                 "edges_added_count": commit_delta.get("edges_added_count", 0),
                                 "edges_removed_count": commit_delta.get("edges_removed_count", 0),
-                            },
-                        }
-                        # Rule check
-                        rules_result = check_rules(compare_like, config, baseline_data.get("active_exceptions", []))
-                        # Cycles: per MT_18 safe rule, keep zero
-                        cycles_result = {
-                            "counts": {"cycles_added_count": 0, "cycles_removed_count": 0},
-                            "cycles_added": [],
-                            "cycles_removed": [],
-                        }
-                        # Classify
-                        analysis = {
-                            "compare": compare_like,
-                            "rules": rules_result,
-                            "cycles": cycles_result,
-                        }
-                        classification_result = classify_drift(analysis)
-                        classification = classification_result.get("classification", "unknown")
-                        reason_codes = classification_result.get("reason_codes", [])
-                        summary = classification_result.get("summary", {})
-                        conformance_summary = {
-                            "edges_added_count": commit_delta.get("edges_added_count", 0),
-                            "edges_removed_count": commit_delta.get("edges_removed_count", 0),
-                            "forbidden_edges_added_count": rules_result.get("counts", {}).get("forbidden_added", 0),
-                            "forbidden_edges_removed_count": rules_result.get("counts", {}).get("forbidden_removed", 0),
-                            "cycles_added_count": 0,
-                            "cycles_removed_count": 0,
-                        }
-                        graph_stats = commit_delta.get("stats", {})
-                        # Build evidence_preview from forbidden edges/cycles matched against commit_delta evidence
-                        # Falls back to edge/cycle data itself if evidence matching fails
-                        evidence_preview = []
-                        forbidden_edges_added_count = rules_result.get("counts", {}).get("forbidden_added", 0)
-                        forbidden_edges_removed_count = rules_result.get("counts", {}).get("forbidden_removed", 0)
-                        cycles_added_count = cycles_result.get("counts", {}).get("cycles_added_count", 0)
-                        cycles_removed_count = cycles_result.get("counts", {}).get("cycles_removed_count", 0)
+                                "forbidden_edges_added_count": rules_result.get("counts", {}).get("forbidden_added", 0),
+                                "forbidden_edges_removed_count": rules_result.get("counts", {}).get("forbidden_removed", 0),
+                                "cycles_added_count": 0,
+                                "cycles_removed_count": 0,
+                            }
+                            graph_stats = commit_delta.get("stats", {})
+                            # Build evidence_preview from forbidden edges/cycles matched against commit_delta evidence
+                            # Falls back to edge/cycle data itself if evidence matching fails
+                            evidence_preview = []
+                            forbidden_edges_added_count = rules_result.get("counts", {}).get("forbidden_added", 0)
+                            forbidden_edges_removed_count = rules_result.get("counts", {}).get("forbidden_removed", 0)
+                            cycles_added_count = cycles_result.get("counts", {}).get("cycles_added_count", 0)
+                            cycles_removed_count = cycles_result.get("counts", {}).get("cycles_removed_count", 0)
                         
-                        # Get all evidence from commit_delta for matching
-                        all_evidence = commit_delta.get("evidence", [])
-                        evidence_by_edge = {}
-                        for ev in all_evidence:
-                            from_mod = ev.get("from_module", "")
-                            to_mod = ev.get("to_module", "")
-                            if from_mod and to_mod:
-                                edge_key = (from_mod, to_mod)
-                                if edge_key not in evidence_by_edge:
-                                    evidence_by_edge[edge_key] = []
-                                evidence_by_edge[edge_key].append(ev)
+                            # Get all evidence from commit_delta for matching
+                            all_evidence = commit_delta.get("evidence", [])
+                            evidence_by_edge = {}
+                            for ev in all_evidence:
+                                from_mod = ev.get("from_module", "")
+                                to_mod = ev.get("to_module", "")
+                                if from_mod and to_mod:
+                                    edge_key = (from_mod, to_mod)
+                                    if edge_key not in evidence_by_edge:
+                                        evidence_by_edge[edge_key] = []
+                                    evidence_by_edge[edge_key].append(ev)
                         
-                        # Handle forbidden edges added
-                        if forbidden_edges_added_count > 0:
-                            forbidden_edges_added = rules_result.get("forbidden_edges_added", [])
-                            for edge in forbidden_edges_added:
-                                from_mod = edge.get("from", "")
-                                to_mod = edge.get("to", "")
-                                if not from_mod or not to_mod:
-                                    continue
-                                edge_key = (from_mod, to_mod)
+                            # Handle forbidden edges added
+                            if forbidden_edges_added_count > 0:
+                                forbidden_edges_added = rules_result.get("forbidden_edges_added", [])
+                                for edge in forbidden_edges_added:
+                                    from_mod = edge.get("from", "")
+                                    to_mod = edge.get("to", "")
+                                    if not from_mod or not to_mod:
+                                        continue
+                                    edge_key = (from_mod, to_mod)
                                 
-                                # Try to match against evidence
-                                matched_ev = None
-                                if edge_key in evidence_by_edge and evidence_by_edge[edge_key]:
-                                    matched_ev = evidence_by_edge[edge_key][0]  # Take first match
+                                    # Try to match against evidence
+                                    matched_ev = None
+                                    if edge_key in evidence_by_edge and evidence_by_edge[edge_key]:
+                                        matched_ev = evidence_by_edge[edge_key][0]  # Take first match
                                 
-                                # Build evidence item (use matched evidence if available, else fallback to edge data)
-                                import_ref = ""
-                                src_file = ""
-                                if matched_ev:
-                                    import_ref = matched_ev.get("import_ref", matched_ev.get("import_text", ""))
-                                    src_file = matched_ev.get("src_file", matched_ev.get("from_file", ""))
-                                else:
-                                    # Fallback: create minimal evidence from edge data
-                                    src_file = f"{from_mod} → {to_mod}"
-                                    import_ref = f"forbidden dependency: {from_mod} → {to_mod}"
+                                    # Build evidence item (use matched evidence if available, else fallback to edge data)
+                                    import_ref = ""
+                                    src_file = ""
+                                    if matched_ev:
+                                        import_ref = matched_ev.get("import_ref", matched_ev.get("import_text", ""))
+                                        src_file = matched_ev.get("src_file", matched_ev.get("from_file", ""))
+                                    else:
+                                        # Fallback: create minimal evidence from edge data
+                                        src_file = f"{from_mod} → {to_mod}"
+                                        import_ref = f"forbidden dependency: {from_mod} → {to_mod}"
                                 
-                                evidence_preview.append({
-                                    "rule": "forbidden_edge_added",
-                                    "from_module": from_mod,
-                                    "to_module": to_mod,
-                                    "src_file": src_file,
-                                    "to_file": matched_ev.get("to_file", "") if matched_ev else "",
-                                    "import_ref": import_ref,
-                                    "import_text": import_ref,  # Frontend expects import_text
-                                    "direction": "added",  # Frontend expects direction field
-                                })
+                                    evidence_preview.append({
+                                        "rule": "forbidden_edge_added",
+                                        "from_module": from_mod,
+                                        "to_module": to_mod,
+                                        "src_file": src_file,
+                                        "to_file": matched_ev.get("to_file", "") if matched_ev else "",
+                                        "import_ref": import_ref,
+                                        "import_text": import_ref,  # Frontend expects import_text
+                                        "direction": "added",  # Frontend expects direction field
+                                    })
                         
-                        # Handle forbidden edges removed
-                        if forbidden_edges_removed_count > 0:
-                            forbidden_edges_removed = rules_result.get("forbidden_edges_removed", [])
-                            for edge in forbidden_edges_removed:
-                                from_mod = edge.get("from", "")
-                                to_mod = edge.get("to", "")
-                                if not from_mod or not to_mod:
-                                    continue
-                                edge_key = (from_mod, to_mod)
+                            # Handle forbidden edges removed
+                            if forbidden_edges_removed_count > 0:
+                                forbidden_edges_removed = rules_result.get("forbidden_edges_removed", [])
+                                for edge in forbidden_edges_removed:
+                                    from_mod = edge.get("from", "")
+                                    to_mod = edge.get("to", "")
+                                    if not from_mod or not to_mod:
+                                        continue
+                                    edge_key = (from_mod, to_mod)
                                 
-                                # Try to match against evidence
-                                matched_ev = None
-                                if edge_key in evidence_by_edge and evidence_by_edge[edge_key]:
-                                    matched_ev = evidence_by_edge[edge_key][0]
+                                    # Try to match against evidence
+                                    matched_ev = None
+                                    if edge_key in evidence_by_edge and evidence_by_edge[edge_key]:
+                                        matched_ev = evidence_by_edge[edge_key][0]
                                 
-                                import_ref = ""
-                                src_file = ""
-                                if matched_ev:
-                                    import_ref = matched_ev.get("import_ref", matched_ev.get("import_text", ""))
-                                    src_file = matched_ev.get("src_file", matched_ev.get("from_file", ""))
-                                else:
-                                    src_file = f"{from_mod} → {to_mod}"
-                                    import_ref = f"forbidden dependency removed: {from_mod} → {to_mod}"
+                                    import_ref = ""
+                                    src_file = ""
+                                    if matched_ev:
+                                        import_ref = matched_ev.get("import_ref", matched_ev.get("import_text", ""))
+                                        src_file = matched_ev.get("src_file", matched_ev.get("from_file", ""))
+                                    else:
+                                        src_file = f"{from_mod} → {to_mod}"
+                                        import_ref = f"forbidden dependency removed: {from_mod} → {to_mod}"
                                 
-                                evidence_preview.append({
-                                    "rule": "forbidden_edge_removed",
-                                    "from_module": from_mod,
-                                    "to_module": to_mod,
-                                    "src_file": src_file,
-                                    "to_file": matched_ev.get("to_file", "") if matched_ev else "",
-                                    "import_ref": import_ref,
-                                    "import_text": import_ref,
-                                    "direction": "removed",  # Frontend expects direction field
-                                })
+                                    evidence_preview.append({
+                                        "rule": "forbidden_edge_removed",
+                                        "from_module": from_mod,
+                                        "to_module": to_mod,
+                                        "src_file": src_file,
+                                        "to_file": matched_ev.get("to_file", "") if matched_ev else "",
+                                        "import_ref": import_ref,
+                                        "import_text": import_ref,
+                                        "direction": "removed",  # Frontend expects direction field
+                                    })
                         
-                        # Handle cycles added
-                        if cycles_added_count > 0:
-                            cycles_added = cycles_result.get("cycles_added", [])
-                            for cycle in cycles_added:
-                                if not cycle or len(cycle) < 2:
-                                    continue
-                                # Format cycle as module path
-                                cycle_path = " → ".join(cycle)
-                                if len(cycle) > 1:
-                                    cycle_path += f" → {cycle[0]}"  # Close the cycle
+                            # Handle cycles added
+                            if cycles_added_count > 0:
+                                cycles_added = cycles_result.get("cycles_added", [])
+                                for cycle in cycles_added:
+                                    if not cycle or len(cycle) < 2:
+                                        continue
+                                    # Format cycle as module path
+                                    cycle_path = " → ".join(cycle)
+                                    if len(cycle) > 1:
+                                        cycle_path += f" → {cycle[0]}"  # Close the cycle
                                 
-                                evidence_preview.append({
-                                    "rule": "cycle_added",
-                                    "from_module": cycle[0] if cycle else "",
-                                    "to_module": cycle[1] if len(cycle) > 1 else "",
-                                    "src_file": f"Cycle: {cycle_path}",
-                                    "to_file": "",
-                                    "import_ref": f"dependency cycle detected: {cycle_path}",
-                                    "import_text": f"dependency cycle detected: {cycle_path}",
-                                    "direction": "added",  # Frontend expects direction field
-                                })
+                                    evidence_preview.append({
+                                        "rule": "cycle_added",
+                                        "from_module": cycle[0] if cycle else "",
+                                        "to_module": cycle[1] if len(cycle) > 1 else "",
+                                        "src_file": f"Cycle: {cycle_path}",
+                                        "to_file": "",
+                                        "import_ref": f"dependency cycle detected: {cycle_path}",
+                                        "import_text": f"dependency cycle detected: {cycle_path}",
+                                        "direction": "added",  # Frontend expects direction field
+                                    })
                         
-                        # Handle cycles removed
-                        if cycles_removed_count > 0:
-                            cycles_removed = cycles_result.get("cycles_removed", [])
-                            for cycle in cycles_removed:
-                                if not cycle or len(cycle) < 2:
-                                    continue
-                                cycle_path = " → ".join(cycle)
-                                if len(cycle) > 1:
-                                    cycle_path += f" → {cycle[0]}"
+                            # Handle cycles removed
+                            if cycles_removed_count > 0:
+                                cycles_removed = cycles_result.get("cycles_removed", [])
+                                for cycle in cycles_removed:
+                                    if not cycle or len(cycle) < 2:
+                                        continue
+                                    cycle_path = " → ".join(cycle)
+                                    if len(cycle) > 1:
+                                        cycle_path += f" → {cycle[0]}"
                                 
-                                evidence_preview.append({
-                                    "rule": "cycle_removed",
-                                    "from_module": cycle[0] if cycle else "",
-                                    "to_module": cycle[1] if len(cycle) > 1 else "",
-                                    "src_file": f"Cycle removed: {cycle_path}",
-                                    "to_file": "",
-                                    "import_ref": f"dependency cycle removed: {cycle_path}",
-                                    "import_text": f"dependency cycle removed: {cycle_path}",
-                                    "direction": "removed",  # Frontend expects direction field
-                                })
+                                    evidence_preview.append({
+                                        "rule": "cycle_removed",
+                                        "from_module": cycle[0] if cycle else "",
+                                        "to_module": cycle[1] if len(cycle) > 1 else "",
+                                        "src_file": f"Cycle removed: {cycle_path}",
+                                        "to_file": "",
+                                        "import_ref": f"dependency cycle removed: {cycle_path}",
+                                        "import_text": f"dependency cycle removed: {cycle_path}",
+                                        "direction": "removed",  # Frontend expects direction field
+                                    })
                         
-                        # Sort deterministically and take top 10
-                        evidence_preview = sorted(
-                            evidence_preview,
-                            key=lambda e: (
-                                e.get("rule", ""),
-                                e.get("from_module", ""),
-                                e.get("to_module", ""),
-                                e.get("src_file", ""),
-                                e.get("import_ref", ""),
-                            ),
-                        )[:10]
-
-            # Readiness guardrail
-            is_ready, readiness_reasons = assess_conformance_readiness(
-                baseline_summary=baseline_summary,
-                baseline_edges_count=baseline_edges_count,
-                graph_stats=graph_stats,
-            )
+                            # Sort deterministically and take top 10
+                            evidence_preview = sorted(evidence_preview, key=_EVIDENCE_PREVIEW_SORT_KEY)[:10]
 
-            if not is_ready:
-                classification = "unknown"
-                reason_codes = sorted(set(reason_codes + readiness_reasons))
-                sentiment = "unknown"
-                # Force neutral text to avoid keyword references (applied after text_info is built)
-                text_info_override = {
-                    "title": commit_message_full[:100],
-                    "summary": "Conformance classification is Unknown because the baseline is not ready. Generate + approve a baseline and ensure module mapping covers source paths.",
-                    "functionality": "",
-                    "disadvantage": None,
-                    "rootCause": None,
-                    "recommendedActions": [
-                        "Generate and approve a baseline.",
-                        "Ensure module_map.json covers source paths.",
-                        "Re-run analysis in conformance mode.",
-                    ],
-                }
-            else:
-                # Map classification to sentiment for consistency
-                if classification == "positive":
-                    sentiment = "positive"
-                elif classification == "negative":
-                    sentiment = "negative"
-                elif classification in ("needs_review", "unknown", "no_change"):
-                    sentiment = "negative"
+                # Readiness guardrail
+                is_ready, readiness_reasons = assess_conformance_readiness(
+                    baseline_summary=baseline_summary,
+                    baseline_edges_count=baseline_edges_count,
+                    graph_stats=graph_stats,
+                )
+
+                if not is_ready:
+                    classification = "unknown"
+                    reason_codes = sorted(set(reason_codes + readiness_reasons))
+                    sentiment = "unknown"
+                    # Force neutral text to avoid keyword references (applied after text_info is built)
+                    text_info_override = {
+                        "title": commit_message_full[:100],
+                        "summary": "Conformance classification is Unknown because the baseline is not ready. Generate + approve a baseline and ensure module mapping covers source paths.",
+                        "functionality": "",
+                        "disadvantage": None,
+                        "rootCause": None,
+                        "recommendedActions": [
+                            "Generate and approve a baseline.",
+                            "Ensure module_map.json covers source paths.",
+                            "Re-run analysis in conformance mode.",
+                        ],
+                    }
                 else:
-                    sentiment = "negative"
-        else:
-            # Keywords mode or non-architecture drift: use keyword-based sentiment
-            is_positive = any(keyword in commit_message_lower for keyword in POSITIVE_KEYWORDS)
-            sentiment = "positive" if is_positive else "negative"
+                    # Map classification to sentiment for consistency
+                    if classification == "positive":
+                        sentiment = "positive"
+                    elif classification == "negative":
+                        sentiment = "negative"
+                    elif classification in ("needs_review", "unknown", "no_change"):
+                        sentiment = "negative"
+                    else:
+                        sentiment = "negative"
+            else:
+                # Keywords mode or non-architecture drift: use keyword-based sentiment
+                is_positive = any(keyword in commit_message_lower for keyword in POSITIVE_KEYWORDS)
+                sentiment = "positive" if is_positive else "negative"
         
-        # Analyze drift text from commit data (initialize)
-        text_info = analyze_drift_text(
-            commit_message=commit_message_full,
-            changed_files=files_changed,
-            drift_type=drift_type_category,
-            sentiment=sentiment,
-        )
-        # Apply override if conformance not ready
-        if text_info_override:
-            text_info = {**text_info, **text_info_override}
+            # Analyze drift text from commit data (initialize)
+            text_info = analyze_drift_text(
+                commit_message=commit_message_full,
+                changed_files=files_changed,
+                drift_type=drift_type_category,
+                sentiment=sentiment,
+            )
+            # Apply override if conformance not ready
+            if text_info_override:
+                text_info = {**text_info, **text_info_override}
         
-        # MMM: Mentor - Set default impact and risk areas based on drift type
-        if sentiment == "negative":
-            impact_level = "high"  # Negative drifts are typically high impact
-            risk_areas = ["Maintainability", "Testability"]
-        else:  # positive
-            impact_level = "medium"
-            risk_areas = ["Maintainability"]
+            # MMM: Mentor - Set default impact and risk areas based on drift type
+            if sentiment == "negative":
+                impact_level = "high"  # Negative drifts are typically high impact
+                risk_areas = ["Maintainability", "Testability"]
+            else:  # positive
+                impact_level = "medium"
+                risk_areas = ["Maintainability"]
         
-        # Set advantage for positive drifts
-        advantage = None
-        if sentiment == "positive":
-            advantage = "This change appears to improve the architecture based on commit message keywords."
+            # Set advantage for positive drifts
+            advantage = None
+            if sentiment == "positive":
+                advantage = "This change appears to improve the architecture based on commit message keywords."
         
-        # Create Drift object with all text fields from analyzer
-        bd_safe = baseline_data or {}
-        drift = Drift(
-            id=f"{commit_hash[:8]}",
-            date=commit_date,
-            type=sentiment,
-            title=text_info["title"],
-            summary=text_info["summary"],
-            functionality=text_info["functionality"],
-            advantage=advantage,
-            disadvantage=text_info["disadvantage"],
-            root_cause=text_info["rootCause"],
-            files_changed=files_changed,
-            commit_hash=commit_hash,
-            repo_url=repo_url,
-            teams=teams,
-            driftType=drift_type_category,
-            impactLevel=impact_level,
-            riskAreas=risk_areas,
-            recommendedActions=text_info["recommendedActions"],
-            classification=classification,
-            edges_added_count=conformance_summary.get("edges_added_count", 0) if classification else 0,
-            edges_removed_count=conformance_summary.get("edges_removed_count", 0) if classification else 0,
-            forbidden_edges_added_count=conformance_summary.get("forbidden_edges_added_count", 0) if classification else 0,
-            forbidden_edges_removed_count=conformance_summary.get("forbidden_edges_removed_count", 0) if classification else 0,
-            cycles_added_count=conformance_summary.get("cycles_added_count", 0) if classification else 0,
-            cycles_removed_count=conformance_summary.get("cycles_removed_count", 0) if classification else 0,
-            baseline_hash=bd_safe.get("baseline_hash") if classification else None,
-            rules_hash=rules_hash if classification else None,
-            reason_codes=reason_codes if classification else [],
-            evidence_preview=evidence_preview if classification else [],
-            classifier_mode_used=resolved_mode,
-        )
+            # Create Drift object with all text fields from analyzer
+            bd_safe = baseline_data or {}
+            drift = Drift(
+                id=f"{commit_hash[:8]}",
+                date=commit_date,
+                type=sentiment,
+                title=text_info["title"],
+                summary=text_info["summary"],
+                functionality=text_info["functionality"],
+                advantage=advantage,
+                disadvantage=text_info["disadvantage"],
+                root_cause=text_info["rootCause"],
+                files_changed=files_changed,
+                commit_hash=commit_hash,
+                repo_url=repo_url,
+                teams=teams,
+                driftType=drift_type_category,
+                impactLevel=impact_level,
+                riskAreas=risk_areas,
+                recommendedActions=text_info["recommendedActions"],
+                classification=classification,
+                edges_added_count=conformance_summary.get("edges_added_count", 0) if classification else 0,
+                edges_removed_count=conformance_summary.get("edges_removed_count", 0) if classification else 0,
+                forbidden_edges_added_count=conformance_summary.get("forbidden_edges_added_count", 0) if classification else 0,
+                forbidden_edges_removed_count=conformance_summary.get("forbidden_edges_removed_count", 0) if classification else 0,
+                cycles_added_count=conformance_summary.get("cycles_added_count", 0) if classification else 0,
+                cycles_removed_count=conformance_summary.get("cycles_removed_count", 0) if classification else 0,
+                baseline_hash=bd_safe.get("baseline_hash") if classification else None,
+                rules_hash=rules_hash if classification else None,
+                reason_codes=reason_codes if classification else [],
+                evidence_preview=evidence_preview if classification else [],
+                classifier_mode_used=resolved_mode,
+            )
         
-        drifts.append(drift)
+            drifts.append(drift)
+    finally:
+        if delta_executor is not None:
+            # Cancel deltas not yet started and wait for running ones, so no
+            # worker is still using the repository after this returns
+            delta_executor.shutdown(wait=True, cancel_futures=True)
     
     # Normalize classifier_mode_used: only drifts with actual conformance evidence
     # should have classifier_mode_used="conformance". Others should use "keywords"
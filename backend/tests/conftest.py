@@ -0,0 +1,47 @@
+"""Shared fixtures for the backend test suite."""
+
+import pytest
+from fastapi.testclient import TestClient
+from git import Repo
+
+from main import app
+
+
+@pytest.fixture(autouse=True)
+def onboarding_dir(monkeypatch, tmp_path):
+    """Keep onboarding configs and snapshots in the test's tmp_path instead of backend/.onboarding."""
+    onboarding_dir = tmp_path / ".onboarding"
+    monkeypatch.setenv("ARCHDRIFT_ONBOARDING_DIR", str(onboarding_dir))
+    return onboarding_dir
+
+
+@pytest.fixture(scope="module")
+def client():
+    """One TestClient shared by every test in a module."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def git_template(tmp_path_factory):
+    """Committed repository with src/core/a.py, built once and copied per test."""
+    repo_root = tmp_path_factory.mktemp("template") / "test_repo"
+
+    # Create directory structure and test file
+    (repo_root / "src" / "core").mkdir(parents=True)
+    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
+
+    # Initialize git repository and commit the file
+    repo = Repo.init(repo_root)
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
+    repo.git.add("--all")
+    repo.index.commit("Initial commit")
+    return repo_root
+
+
+@pytest.fixture(scope="session")
+def hex_digits():
+    """Characters allowed in the hex ids returned by the API."""
+    return frozenset("0123456789abcdef")
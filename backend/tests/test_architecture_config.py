@@ -4,6 +4,7 @@ These tests verify that load_architecture_config() correctly loads and validates
 architecture configuration files with proper error handling.
 """
 
+import dataclasses
 import json
 from datetime import date
 from pathlib import Path
@@ -494,3 +495,40 @@ def test_empty_string_values_raise_error(tmp_path):
     assert "unmapped_module_id" in str(exc_info.value)
     assert "must be non-empty" in str(exc_info.value).lower()
 
+
+def test_reload_reflects_changed_config_files(tmp_path):
+    """Test that cached loads return the same config until a file's content changes."""
+    create_valid_module_map(tmp_path)
+    create_valid_allowed_rules(tmp_path)
+    create_valid_exceptions(tmp_path)
+
+    first = load_architecture_config(tmp_path)
+    assert load_architecture_config(tmp_path) is first
+
+    (tmp_path / "module_map.json").write_text(
+        json.dumps(
+            {
+                "version": "1.0",
+                "unmapped_module_id": "unmapped",
+                "modules": [{"id": "core", "roots": ["src/core"]}],
+            },
+            indent=2,
+        )
+    )
+
+    reloaded = load_architecture_config(tmp_path)
+    assert reloaded is not first
+    assert [m.id for m in reloaded.modules] == ["core"]
+
+
+def test_loaded_config_is_frozen(tmp_path):
+    """Test that the shared cached config cannot be reassigned in place."""
+    create_valid_module_map(tmp_path)
+    create_valid_allowed_rules(tmp_path)
+    create_valid_exceptions(tmp_path)
+
+    config = load_architecture_config(tmp_path)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.deny_by_default = False
+    assert dataclasses.replace(config, deny_by_default=False).deny_by_default is False
+    assert load_architecture_config(tmp_path).deny_by_default is True
@@ -5,12 +5,14 @@ to module IDs based on module roots, including longest-root matching and
 path normalization.
 """
 
+import dataclasses
 import json
 from pathlib import Path
 
 import pytest
 
 from utils.architecture_config import ArchitectureConfig, ModuleSpec, load_architecture_config
+from utils import architecture_mapper
 from utils.architecture_mapper import map_path_to_module_id, normalize_repo_path
 
 
@@ -303,3 +305,34 @@ def test_root_with_duplicate_slashes_matches(tmp_path):
 
     assert result == "ui"
 
+
+def test_root_index_built_once_per_config(monkeypatch):
+    """Test that roots are indexed once per config object, not per lookup."""
+    config = ArchitectureConfig(
+        version="1.0",
+        unmapped_module_id="unmapped",
+        modules=[ModuleSpec(id="ui", roots=["src/ui"]), ModuleSpec(id="core", roots=["src/core"])],
+        deny_by_default=True,
+        allowed_edges=[],
+        exceptions=[],
+    )
+    builds = []
+    original_build = architecture_mapper._build_root_index
+
+    def counting_build(modules):
+        builds.append(len(modules))
+        return original_build(modules)
+
+    monkeypatch.setattr(architecture_mapper, "_build_root_index", counting_build)
+
+    assert map_path_to_module_id("src/ui/a.ts", config) == "ui"
+    assert map_path_to_module_id("src/core/b.ts", config) == "core"
+    assert builds == [2]
+
+    # A variant made with dataclasses.replace() gets its own index
+    variant = dataclasses.replace(config, modules=[ModuleSpec(id="core", roots=["src/ui"])])
+    assert map_path_to_module_id("src/ui/a.ts", variant) == "core"
+    assert builds == [2, 1]
+
+    # The index is a cache, not part of the config's value
+    assert variant == dataclasses.replace(variant)
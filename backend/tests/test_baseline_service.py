@@ -101,7 +101,7 @@ def create_test_config(tmp_path: Path) -> Path:
     return cfg_dir
 
 
-def test_generate_baseline_creates_files(tmp_path):
+def test_generate_baseline_creates_files(tmp_path, hex_digits):
     """Test that generate_baseline creates baseline files in deterministic location."""
     repo_dir = create_test_repo(tmp_path)
     cfg_dir = create_test_config(tmp_path)
@@ -113,7 +113,7 @@ def test_generate_baseline_creates_files(tmp_path):
 
     # Verify repo_id is 16 hex chars
     assert len(result["repo_id"]) == 16
-    assert all(c in "0123456789abcdef" for c in result["repo_id"])
+    assert set(result["repo_id"]) <= hex_digits
 
     # Verify baseline dir exists at expected location
     expected_baseline_dir = data_dir / "baselines" / result["repo_id"]
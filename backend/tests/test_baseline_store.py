@@ -18,6 +18,16 @@ from utils.baseline_store import (
 )
 
 
+def _read_json(path: Path):
+    """Read and parse a JSON file in one shot."""
+    return json.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data) -> None:
+    """Serialize data as indented JSON and write it in one shot."""
+    path.write_bytes(json.dumps(data, indent=2).encode("utf-8"))
+
+
 def test_stable_hash_despite_order_and_duplicates():
     """Test that hash is stable despite input edge order and duplicates."""
     edges1 = [{"from": "b", "to": "a"}, {"from": "a", "to": "b"}, {"from": "a", "to": "b"}]
@@ -54,6 +64,11 @@ def test_store_and_load_baseline(tmp_path):
     summary_path = baseline_dir / "baseline_summary.json"
     assert edges_path.exists()
     assert summary_path.exists()
+    # Atomic writes leave no temporary files behind
+    assert sorted(p.name for p in baseline_dir.iterdir()) == [
+        "baseline_edges.json",
+        "baseline_summary.json",
+    ]
 
     # Load and verify
     loaded = load_baseline(baseline_dir)
@@ -72,11 +87,9 @@ def test_hash_mismatch_detection(tmp_path):
 
     # Manually modify baseline_edges.json
     edges_path = baseline_dir / "baseline_edges.json"
-    with open(edges_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(edges_path)
     data["edges"].append({"from": "tampered", "to": "edge"})
-    with open(edges_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_json(edges_path, data)
 
     # Load should fail with hash mismatch
     with pytest.raises(ValueError) as exc_info:
@@ -103,29 +116,22 @@ def test_missing_file_handling(tmp_path):
     assert "baseline_summary.json" in str(exc_info.value)
 
 
-def test_invalid_edge_schema(tmp_path):
-    """Test that invalid edge schema raises ValueError."""
+@pytest.mark.parametrize(
+    "edge, expected_error",
+    [
+        ({"from": "", "to": "x"}, "must be non-empty"),
+        ({"from": "x", "to": ""}, "must be non-empty"),
+        ({"to": "x"}, "missing required key 'from'"),
+        ({"from": "x"}, "missing required key 'to'"),
+    ],
+)
+def test_invalid_edge_schema(tmp_path, edge, expected_error):
+    """Test that invalid edge schema raises ValueError before anything is written."""
     baseline_dir = tmp_path / "baseline"
 
-    # Empty "from"
-    with pytest.raises(ValueError) as exc_info:
-        store_baseline(baseline_dir, [{"from": "", "to": "x"}])
-    assert "must be non-empty" in str(exc_info.value)
-
-    # Empty "to"
-    with pytest.raises(ValueError) as exc_info:
-        store_baseline(baseline_dir, [{"from": "x", "to": ""}])
-    assert "must be non-empty" in str(exc_info.value)
-
-    # Missing "from"
-    with pytest.raises(ValueError) as exc_info:
-        store_baseline(baseline_dir, [{"to": "x"}])
-    assert "missing required key 'from'" in str(exc_info.value)
-
-    # Missing "to"
-    with pytest.raises(ValueError) as exc_info:
-        store_baseline(baseline_dir, [{"from": "x"}])
-    assert "missing required key 'to'" in str(exc_info.value)
+    with pytest.raises(ValueError, match=expected_error):
+        store_baseline(baseline_dir, [edge])
+    assert not baseline_dir.exists()
 
 
 def test_deterministic_file_content(tmp_path):
@@ -141,8 +147,7 @@ def test_deterministic_file_content(tmp_path):
 
     # Read and verify edges are sorted
     edges_path = baseline_dir / "baseline_edges.json"
-    with open(edges_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(edges_path)
 
     stored_edges = data["edges"]
     assert stored_edges == [
@@ -207,11 +212,9 @@ def test_edge_count_validation(tmp_path):
 
     # Manually modify edge_count in summary
     summary_path = baseline_dir / "baseline_summary.json"
-    with open(summary_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(summary_path)
     data["edge_count"] = 999
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_json(summary_path, data)
 
     # Load should fail with edge count mismatch
     with pytest.raises(ValueError) as exc_info:
@@ -277,11 +280,9 @@ def test_hash_length_validation(tmp_path):
 
     # Manually modify hash to wrong length
     summary_path = baseline_dir / "baseline_summary.json"
-    with open(summary_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _read_json(summary_path)
     data["baseline_hash_sha256"] = "short"
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    _write_json(summary_path, data)
 
     with pytest.raises(ValueError) as exc_info:
         load_baseline(baseline_dir)
@@ -8,6 +8,7 @@ These tests verify that:
 
 import json
 import os
+import shutil
 from pathlib import Path
 
 import pytest
@@ -18,13 +19,9 @@ from utils.baseline_store import store_baseline
 from utils.architecture_config import _get_default_config_dir, load_architecture_config
 
 
-def _write_architecture_config(tmpdir: Path):
-    """Create architecture config files in tmpdir/architecture."""
-    config_dir = tmpdir / "architecture"
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    # module_map.json
-    module_map = {
+# Architecture config files, serialized once at import time
+_MODULE_MAP_BYTES = json.dumps(
+    {
         "version": "1.0",
         "unmapped_module_id": "unmapped",
         "modules": [
@@ -32,52 +29,68 @@ def _write_architecture_config(tmpdir: Path):
             {"id": "core", "roots": ["core"]},
         ],
     }
-    (config_dir / "module_map.json").write_text(json.dumps(module_map), encoding="utf-8")
-
-    # allowed_rules.json
-    allowed_rules = {
+).encode("utf-8")
+_ALLOWED_RULES_BYTES = json.dumps(
+    {
         "version": "1.0",
         "deny_by_default": False,
         "allowed_edges": [],
     }
-    (config_dir / "allowed_rules.json").write_text(json.dumps(allowed_rules), encoding="utf-8")
+).encode("utf-8")
+_EXCEPTIONS_BYTES = json.dumps({"version": "1.0", "exceptions": []}).encode("utf-8")
 
-    # exceptions.json (none)
-    exceptions = {"version": "1.0", "exceptions": []}
-    (config_dir / "exceptions.json").write_text(json.dumps(exceptions), encoding="utf-8")
 
+def _write_architecture_config(tmpdir: Path):
+    """Create architecture config files in tmpdir/architecture."""
+    config_dir = tmpdir / "architecture"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    (config_dir / "module_map.json").write_bytes(_MODULE_MAP_BYTES)
+    (config_dir / "allowed_rules.json").write_bytes(_ALLOWED_RULES_BYTES)
+    (config_dir / "exceptions.json").write_bytes(_EXCEPTIONS_BYTES)
     return config_dir
 
 
+# Minimal test repository: Python files plus a bare .git marker (not a real git repo)
+_TEST_REPO_FILES = {
+    "ui/main.py": "from core import helper\n",
+    "core/helper.py": "# Helper module\n",
+    ".git/HEAD": "ref: refs/heads/main\n",
+}
+
+
 def _create_test_repo(tmpdir: Path) -> Path:
     """Create a minimal test repository."""
     repo_dir = tmpdir / "test_repo"
-    repo_dir.mkdir()
+    for rel_path, content in _TEST_REPO_FILES.items():
+        file_path = repo_dir / rel_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+    return repo_dir
 
-    # Create simple Python files
-    ui_dir = repo_dir / "ui"
-    ui_dir.mkdir()
-    (ui_dir / "main.py").write_text("from core import helper\n")
 
-    core_dir = repo_dir / "core"
-    core_dir.mkdir()
-    (core_dir / "helper.py").write_text("# Helper module\n")
+@pytest.fixture(scope="session")
+def repo_template(tmp_path_factory) -> Path:
+    """Build the test repo + architecture config once and archive it as a tarball."""
+    staging = tmp_path_factory.mktemp("repo_template_staging")
+    _create_test_repo(staging)
+    _write_architecture_config(staging)
+    archive_base = tmp_path_factory.mktemp("repo_template") / "template"
+    return Path(shutil.make_archive(str(archive_base), "tar", root_dir=staging))
 
-    # Initialize git repo (minimal - just create .git directory)
-    git_dir = repo_dir / ".git"
-    git_dir.mkdir()
-    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
 
-    return repo_dir
+@pytest.fixture
+def fresh_repo(tmp_path, repo_template) -> tuple[Path, Path]:
+    """Extract the template into tmp_path and return (repo_dir, config_dir)."""
+    shutil.unpack_archive(str(repo_template), str(tmp_path))
+    return tmp_path / "test_repo", tmp_path / "architecture"
 
 
-def test_classifier_mode_override_forced_conformance(tmp_path, monkeypatch):
+def test_classifier_mode_override_forced_conformance(tmp_path, monkeypatch, fresh_repo):
     """Test that classifier_mode override forces conformance mode even when env var is not set."""
     # Ensure env var is not set
     monkeypatch.delenv("DRIFT_CLASSIFIER_MODE", raising=False)
 
-    repo_dir = _create_test_repo(tmp_path)
-    config_dir = _write_architecture_config(tmp_path)
+    repo_dir, config_dir = fresh_repo
 
     # Generate baseline
     try:
@@ -144,12 +157,12 @@ def test_classifier_mode_override_forced_conformance(tmp_path, monkeypatch):
                 ), f"Expected reason_codes to contain one of {expected_reasons}, got {drift.reason_codes}"
 
 
-def test_classifier_mode_override_keywords(tmp_path, monkeypatch):
+def test_classifier_mode_override_keywords(tmp_path, monkeypatch, fresh_repo):
     """Test that classifier_mode override can force keywords mode."""
     # Set env to conformance
     monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
 
-    repo_dir = _create_test_repo(tmp_path)
+    repo_dir, _ = fresh_repo
 
     commits = [
         {
@@ -180,13 +193,12 @@ def test_classifier_mode_override_keywords(tmp_path, monkeypatch):
         assert drift.classification is None, "In keywords mode, classification should be None"
 
 
-def test_analyze_repo_with_classifier_mode_override(tmp_path, monkeypatch):
+def test_analyze_repo_with_classifier_mode_override(tmp_path, monkeypatch, fresh_repo):
     """Test analyze_repo_for_drifts with classifier_mode override."""
     # Ensure env var is not set
     monkeypatch.delenv("DRIFT_CLASSIFIER_MODE", raising=False)
 
-    repo_dir = _create_test_repo(tmp_path)
-    config_dir = _write_architecture_config(tmp_path)
+    repo_dir, config_dir = fresh_repo
 
     base_clone_dir = str(tmp_path / ".repos")
 
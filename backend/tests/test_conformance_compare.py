@@ -262,3 +262,10 @@ def test_compare_edges_sorted_output():
     # Verify divergence is sorted
     assert result["divergence"] == [{"from": "new", "to": "old"}]
 
+
+def test_compare_edges_validates_tuple_input():
+    """Test that compare_edges validates edges even when they arrive as tuples."""
+    with pytest.raises(ValueError, match="must be a dictionary"):
+        compare_edges([("a", "b")], [("a", "b"), ("b", "c")])
+    with pytest.raises(ValueError, match="'to' must be non-empty"):
+        compare_edges([{"from": "a", "to": ""}], [])
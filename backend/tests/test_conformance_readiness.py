@@ -1,12 +1,25 @@
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
 
-from services.drift_engine import commits_to_drifts
+from services.drift_engine import commits_to_drifts, get_drift_max_workers
 from utils.drift_classifier import assess_conformance_readiness
 
 
+@pytest.fixture(autouse=True)
+def conformance_mode(monkeypatch):
+    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
+
+
+def _install_fake_rules(monkeypatch, delta, rules):
+    """Stub the commit delta and rule check used by commits_to_drifts."""
+    monkeypatch.setattr("services.drift_engine.build_commit_delta", lambda *a, **k: delta)
+    monkeypatch.setattr("services.drift_engine.check_rules", lambda *a, **k: rules)
+
+
 def test_assess_baseline_missing():
     ready, reasons = assess_conformance_readiness(
         baseline_summary=None,
@@ -47,8 +60,7 @@ def test_assess_ready():
     assert reasons == []
 
 
-def test_commit_drift_baseline_missing_sets_unknown(monkeypatch, tmp_path):
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
+def test_commit_drift_baseline_missing_sets_unknown(tmp_path):
     # Minimal config and baseline placeholders
     config = object()
     baseline_data = {
@@ -76,14 +88,13 @@ def test_commit_drift_baseline_missing_sets_unknown(monkeypatch, tmp_path):
 
 
 def test_commit_drift_ready_keeps_classification(monkeypatch, tmp_path):
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-
     class DummyConfig:
         modules = []
         unmapped_module_id = "unmapped"
 
-    def fake_build_commit_delta(repo_path, commit_sha, config, limits):
-        return {
+    _install_fake_rules(
+        monkeypatch,
+        delta={
             "edges_added": [{"from": "a", "to": "b"}],
             "edges_removed": [],
             "edges_added_count": 1,
@@ -91,10 +102,8 @@ def test_commit_drift_ready_keeps_classification(monkeypatch, tmp_path):
             "evidence": [],
             "truncated": False,
             "stats": {"included_files": 10, "unmapped_files": 0},
-        }
-
-    def fake_check_rules(compare_like, config, active_exceptions):
-        return {
+        },
+        rules={
             "counts": {
                 "forbidden_added": 1,
                 "forbidden_removed": 0,
@@ -102,10 +111,8 @@ def test_commit_drift_ready_keeps_classification(monkeypatch, tmp_path):
             "forbidden_edges_added": [{"from": "a", "to": "b"}],
             "forbidden_edges_removed": [],
             "error": None,
-        }
-
-    monkeypatch.setattr("services.drift_engine.build_commit_delta", fake_build_commit_delta)
-    monkeypatch.setattr("services.drift_engine.check_rules", fake_check_rules)
+        },
+    )
 
     baseline_data = {
         "baseline_hash": "hash",
@@ -131,3 +138,108 @@ def test_commit_drift_ready_keeps_classification(monkeypatch, tmp_path):
     assert "BASELINE_MISSING" not in d.reason_codes
     assert "keyword" not in (d.summary or "").lower()
 
+
+def test_commit_deltas_keep_commit_order(monkeypatch, tmp_path):
+    class DummyConfig:
+        modules = []
+        unmapped_module_id = "unmapped"
+
+    def fake_delta(repo_path, commit_sha, config, limits=None):
+        # Earlier commits finish last, so results arrive out of order
+        index = int(commit_sha[1:])
+        time.sleep(0.01 * (4 - index))
+        return {
+            "edges_added": [{"from": "a", "to": f"m{i}"} for i in range(index)],
+            "edges_removed": [],
+            "edges_added_count": index,
+            "edges_removed_count": 0,
+            "evidence": [],
+            "truncated": False,
+            "stats": {"included_files": 10, "unmapped_files": 0},
+        }
+
+    monkeypatch.setenv("DRIFT_MAX_WORKERS", "4")
+    monkeypatch.setattr("services.drift_engine.build_commit_delta", fake_delta)
+    monkeypatch.setattr(
+        "services.drift_engine.check_rules",
+        lambda *a, **k: {"counts": {"forbidden_added": 0, "forbidden_removed": 0}, "error": None},
+    )
+
+    drifts = commits_to_drifts(
+        repo_url="repo",
+        commits=[
+            {"hash": f"h{i}", "date": "2024-01-01T00:00:00Z", "message": "msg", "files_changed": []}
+            for i in range(4)
+        ],
+        max_drifts=4,
+        repo_root_path=str(tmp_path),
+        config=DummyConfig(),
+        baseline_data={
+            "baseline_hash": "hash",
+            "baseline_summary": {"baseline_hash_sha256": "hash", "edge_count": 1},
+            "baseline_edges_count": 1,
+            "active_exceptions": [],
+        },
+        rules_hash="rh",
+    )
+    assert [d.commit_hash for d in drifts] == ["h0", "h1", "h2", "h3"]
+    assert [d.edges_added_count for d in drifts] == [0, 1, 2, 3]
+
+
+def test_commit_deltas_stopped_when_drift_loop_fails(monkeypatch, tmp_path):
+    class DummyConfig:
+        modules = []
+        unmapped_module_id = "unmapped"
+
+    started: list[str] = []
+    finished: list[str] = []
+
+    def fake_delta(repo_path, commit_sha, config, limits=None):
+        started.append(commit_sha)
+        time.sleep(0.05)
+        finished.append(commit_sha)
+        return {
+            "edges_added": [],
+            "edges_removed": [],
+            "edges_added_count": 0,
+            "edges_removed_count": 0,
+            "evidence": [],
+            "truncated": False,
+            "stats": {"included_files": 10, "unmapped_files": 0},
+        }
+
+    def failing_check_rules(*args, **kwargs):
+        raise RuntimeError("rule check exploded")
+
+    monkeypatch.setenv("DRIFT_MAX_WORKERS", "1")
+    monkeypatch.setattr("services.drift_engine.build_commit_delta", fake_delta)
+    monkeypatch.setattr("services.drift_engine.check_rules", failing_check_rules)
+
+    with pytest.raises(RuntimeError, match="rule check exploded"):
+        commits_to_drifts(
+            repo_url="repo",
+            commits=[
+                {"hash": f"h{i}", "date": "2024-01-01T00:00:00Z", "message": "msg", "files_changed": []}
+                for i in range(4)
+            ],
+            max_drifts=4,
+            repo_root_path=str(tmp_path),
+            config=DummyConfig(),
+            baseline_data={
+                "baseline_hash": "hash",
+                "baseline_summary": {"baseline_hash_sha256": "hash", "edge_count": 1},
+                "baseline_edges_count": 1,
+                "active_exceptions": [],
+            },
+            rules_hash="rh",
+        )
+
+    # Queued deltas are cancelled and running ones have finished
+    assert finished == started
+    assert len(started) < 4
+
+
+@pytest.mark.parametrize("env_value, expected", [("3", 3), ("0", None), ("abc", None), ("", None)])
+def test_get_drift_max_workers(monkeypatch, env_value, expected):
+    monkeypatch.setenv("DRIFT_MAX_WORKERS", env_value)
+    assert get_drift_max_workers() == (expected or os.cpu_count() or 1)
@@ -176,6 +176,39 @@ def test_diff_cycles_removed():
     assert len(result["cycles_removed"]) == 1
 
 
+def test_diff_cycles_added_acyclic_edge_keeps_cycles():
+    """Test that adding an edge outside any cycle leaves the cycle set unchanged."""
+    old_edges = [
+        {"from": "A", "to": "B"},
+        {"from": "B", "to": "A"},
+    ]
+    new_edges = old_edges + [{"from": "B", "to": "C"}]
+
+    result = diff_cycles(old_edges, new_edges)
+
+    assert result["new_cycles"] == result["old_cycles"] == [["A", "B"]]
+    assert result["new_cycles"] is not result["old_cycles"]
+    assert result["cycles_added"] == []
+    assert result["cycles_removed"] == []
+
+
+def test_diff_cycles_added_edges_close_cycle_together():
+    """Test that a cycle formed only by several added edges is reported."""
+    old_edges = [
+        {"from": "A", "to": "B"},
+    ]
+    new_edges = [
+        {"from": "A", "to": "B"},
+        {"from": "B", "to": "C"},
+        {"from": "C", "to": "A"},
+    ]
+
+    result = diff_cycles(old_edges, new_edges)
+
+    assert result["cycles_added"] == [["A", "B", "C"]]
+    assert result["counts"]["new_cycles_count"] == 1
+
+
 def test_max_cycles_cap():
     """Test that max_cycles cap is enforced."""
     # Create a graph with many cycles (complete graph of 10 nodes has many cycles)
@@ -213,6 +246,11 @@ def test_canonicalise_cycle():
     # Should choose lexicographically smaller: (A, B) vs (B, A) -> (A, B)
     assert canonical3 == ("A", "B")
 
+    # Test repeated smallest module: least rotation, not first occurrence
+    cycle4 = ["A", "C", "A", "B"]
+    canonical4 = canonicalise_cycle(cycle4)
+    assert canonical4 == ("A", "B", "A", "C")
+
 
 def test_invalid_edges():
     """Test that invalid edges are handled gracefully."""
@@ -250,3 +288,80 @@ def test_complex_graph_multiple_paths():
     assert {"A", "B", "C"} in cycle_sets
     assert {"D", "E"} in cycle_sets
 
+
+def test_long_cycle_does_not_hit_recursion_limit():
+    """Test that a cycle longer than the recursion limit is still detected."""
+    length = 5000
+    edges = [{"from": f"M{i}", "to": f"M{(i + 1) % length}"} for i in range(length)]
+
+    result = detect_cycles(edges)
+
+    assert result["cycles_count"] == 1
+    assert len(result["cycles"][0]) == length
+    assert result["truncated"] is False
+
+
+def test_overlapping_cycles_share_nodes():
+    """Test that cycles sharing a node are all reported."""
+    edges = [
+        # A->B->A and A->C->A share A; B->C->B shares B and C
+        {"from": "A", "to": "B"},
+        {"from": "B", "to": "A"},
+        {"from": "A", "to": "C"},
+        {"from": "C", "to": "A"},
+        {"from": "B", "to": "C"},
+        {"from": "C", "to": "B"},
+    ]
+
+    result = detect_cycles(edges)
+
+    assert ["A", "B"] in result["cycles"]
+    assert ["A", "C"] in result["cycles"]
+    assert ["B", "C"] in result["cycles"]
+    assert ["A", "B", "C"] in result["cycles"]
+    assert result["truncated"] is False
+
+
+def test_max_cycles_cap_exact_count_not_truncated():
+    """Test that exactly max_cycles cycles are returned without truncation."""
+    edges = []
+    for i in range(5):
+        edges.append({"from": f"A{i}", "to": f"B{i}"})
+        edges.append({"from": f"B{i}", "to": f"A{i}"})
+
+    result = detect_cycles(edges, max_cycles=5)
+
+    assert result["cycles_count"] == 5
+    assert result["truncated"] is False
+
+
+def test_tuple_edges_match_dict_edges():
+    """Test that (from, to) tuple edges give the same result as edge dicts."""
+    edges = [
+        {"from": "A", "to": "B"},
+        {"from": "B", "to": "C"},
+        {"from": "C", "to": "A"},
+        {"from": "C", "to": "D"},
+        {"from": "D", "to": "C"},
+    ]
+
+    tuple_edges = [(edge["from"], edge["to"]) for edge in edges]
+
+    assert detect_cycles(tuple_edges) == detect_cycles(edges)
+
+
+def test_repeat_calls_return_independent_results():
+    """Test that mutating a result does not leak into later calls on the same edges."""
+    edges = [
+        {"from": "A", "to": "B"},
+        {"from": "B", "to": "A"},
+    ]
+
+    first = detect_cycles(edges)
+    first["cycles"][0].append("X")
+    first["cycles"].append(["Y"])
+
+    second = detect_cycles(list(reversed(edges)))
+
+    assert second["cycles"] == [["A", "B"]]
+    assert second["cycles_count"] == 1
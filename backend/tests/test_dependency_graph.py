@@ -6,6 +6,8 @@ module-level dependency graph.
 """
 
 import json
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -98,10 +100,22 @@ def create_test_config(tmp_path: Path) -> Path:
     return cfg_dir
 
 
-def test_basic_dependency_graph(tmp_path):
+@pytest.fixture(scope="session")
+def golden_repo(tmp_path_factory) -> Path:
+    """Standard test repository, built once per session. Tests must not modify it."""
+    return create_test_repo(tmp_path_factory.mktemp("golden"))
+
+
+@pytest.fixture(scope="session")
+def golden_cfg(tmp_path_factory) -> Path:
+    """Standard test architecture configuration, built once per session. Read-only."""
+    return create_test_config(tmp_path_factory.mktemp("golden"))
+
+
+def test_basic_dependency_graph(golden_repo, golden_cfg):
     """Test that basic dependency graph is built correctly."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -111,10 +125,10 @@ def test_basic_dependency_graph(tmp_path):
     assert {"from": "ui", "to": "core"} in edges
 
 
-def test_ts_import_creates_edge(tmp_path):
+def test_ts_import_creates_edge(golden_repo, golden_cfg):
     """Test that TS relative import creates edge (same as Python, deduplicated)."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -128,10 +142,10 @@ def test_ts_import_creates_edge(tmp_path):
     assert ui_to_core_count == 1
 
 
-def test_edges_unique_and_sorted(tmp_path):
+def test_edges_unique_and_sorted(golden_repo, golden_cfg):
     """Test that edges list is unique and sorted."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -147,10 +161,10 @@ def test_edges_unique_and_sorted(tmp_path):
     assert edges == sorted_edges
 
 
-def test_evidence_structure(tmp_path):
+def test_evidence_structure(golden_repo, golden_cfg):
     """Test that evidence contains correct structure."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -177,10 +191,10 @@ def test_evidence_structure(tmp_path):
     assert ev["lang"] in ("py", "tsjs")
 
 
-def test_scanned_files_count(tmp_path):
+def test_scanned_files_count(golden_repo, golden_cfg):
     """Test that scanned_files and included_files are non-zero."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -190,10 +204,10 @@ def test_scanned_files_count(tmp_path):
     assert result["scanned_files"] >= result["included_files"]
 
 
-def test_unresolved_imports_zero(tmp_path):
+def test_unresolved_imports_zero(golden_repo, golden_cfg):
     """Test that unresolved_imports is 0 for valid setup."""
-    repo_dir = create_test_repo(tmp_path)
-    cfg_dir = create_test_config(tmp_path)
+    repo_dir = golden_repo
+    cfg_dir = golden_cfg
 
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
@@ -252,9 +266,9 @@ def test_bounds_max_files(tmp_path):
     assert result["scanned_files"] == max_files
 
 
-def test_invalid_repo_root_raises_error(tmp_path):
+def test_invalid_repo_root_raises_error(tmp_path, golden_cfg):
     """Test that invalid repo_root raises ValueError."""
-    cfg_dir = create_test_config(tmp_path)
+    cfg_dir = golden_cfg
     config = load_architecture_config(cfg_dir)
 
     # Non-existent path
@@ -270,7 +284,7 @@ def test_invalid_repo_root_raises_error(tmp_path):
     assert "not a directory" in str(exc_info.value)
 
 
-def test_ignored_directories(tmp_path):
+def test_ignored_directories(tmp_path, golden_cfg):
     """Test that ignored directories are not scanned."""
     repo_dir = tmp_path / "repo"
     repo_dir.mkdir()
@@ -285,7 +299,7 @@ def test_ignored_directories(tmp_path):
     src_dir.mkdir()
     (src_dir / "main.py").write_text("")
 
-    cfg_dir = create_test_config(tmp_path)
+    cfg_dir = golden_cfg
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config)
 
@@ -295,7 +309,7 @@ def test_ignored_directories(tmp_path):
     assert len(node_modules_files) == 0
 
 
-def test_file_size_limit(tmp_path):
+def test_file_size_limit(tmp_path, golden_cfg):
     """Test that files exceeding max_file_bytes are skipped."""
     repo_dir = tmp_path / "repo"
     repo_dir.mkdir()
@@ -309,7 +323,7 @@ def test_file_size_limit(tmp_path):
     normal_file = repo_dir / "normal.py"
     normal_file.write_text("import os\n")
 
-    cfg_dir = create_test_config(tmp_path)
+    cfg_dir = golden_cfg
     config = load_architecture_config(cfg_dir)
     result = build_dependency_graph(repo_dir, config, max_file_bytes=200_000)
 
@@ -539,4 +553,73 @@ def test_python_absolute_import_src_layout(tmp_path):
     # Assert edge ui -> core exists from absolute import
     edges = result["edges"]
     assert {"from": "ui", "to": "core"} in edges
-    assert result["unresolved_imports"] == 0
\ No newline at end of file
+    assert result["unresolved_imports"] == 0
+
+
+def test_nested_python_imports_create_edges(tmp_path, golden_cfg):
+    """Test that imports after code and inside functions/try blocks are found."""
+    repo_dir = create_test_repo(tmp_path)
+    cfg_dir = golden_cfg
+    (repo_dir / "pkg" / "ui" / "a.py").write_text(
+        "VALUE = 1\n"
+        "\n"
+        "def load():\n"
+        "    try:\n"
+        "        from ..core import x\n"
+        "    except ImportError:\n"
+        "        return None\n"
+        "    return x\n"
+    )
+
+    config = load_architecture_config(cfg_dir)
+    result = build_dependency_graph(repo_dir, config)
+
+    assert {"from": "ui", "to": "core"} in result["edges"]
+    assert any(e["from_file"] == "pkg/ui/a.py" for e in result["evidence"])
+
+
+def test_edit_between_builds_is_reflected(tmp_path, golden_cfg):
+    """Test that a same-size edit with an unchanged mtime is seen by the next build."""
+    repo_dir = create_test_repo(tmp_path)
+    config = load_architecture_config(golden_cfg)
+
+    # Age the tree so no file looks recently modified
+    an_hour_ago = time.time() - 3600
+    for path in repo_dir.rglob("*"):
+        if path.is_file():
+            os.utime(path, (an_hour_ago, an_hour_ago))
+
+    first = build_dependency_graph(repo_dir, config)
+    assert {"from": "ui", "to": "core"} in first["edges"]
+
+    # Retarget the import within ui, keeping the file's size and mtime
+    a_path = repo_dir / "pkg" / "ui" / "a.py"
+    before = a_path.stat()
+    a_path.write_text("from ..ui   import x\n")
+    os.utime(a_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert a_path.stat().st_size == before.st_size
+
+    second = build_dependency_graph(repo_dir, config)
+    assert {"from": "ui", "to": "core"} not in second["edges"]
+
+
+def test_symlinked_source_dir_followed_without_cycling(tmp_path, golden_cfg):
+    """Test that symlinked directories are scanned and a symlink cycle is not re-entered."""
+    repo_dir = create_test_repo(tmp_path)
+
+    # Move pkg/ui outside the repo and link it back in, then link core back to pkg
+    ui_target = tmp_path / "ui_src"
+    (repo_dir / "pkg" / "ui").rename(ui_target)
+    try:
+        (repo_dir / "pkg" / "ui").symlink_to(ui_target, target_is_directory=True)
+        (repo_dir / "pkg" / "core" / "loop").symlink_to(repo_dir / "pkg", target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported")
+
+    config = load_architecture_config(golden_cfg)
+    result = build_dependency_graph(repo_dir, config)
+
+    assert {"from": "ui", "to": "core"} in result["edges"]
+    from_files = {e["from_file"] for e in result["evidence"]}
+    assert "pkg/ui/a.py" in from_files
+    assert not any("loop" in path for path in from_files)
@@ -193,3 +193,41 @@ def test_import_from_with_no_module():
     result = extract_python_import_modules(source, internal_prefixes=None)
     assert result == ["."]
 
+
+def test_imports_in_nested_blocks():
+    """Test that imports inside functions, try and if blocks are found."""
+    source = """
+VALUE = 1
+
+def load():
+    try:
+        from .fast import impl
+    except ImportError:
+        from .slow import impl
+    return impl
+
+if VALUE:
+    import myapp.extra
+"""
+    result = extract_python_import_modules(source, internal_prefixes={"myapp"})
+    assert result == [".fast", ".slow", "myapp.extra"]
+
+
+def test_repeated_source_returns_independent_lists():
+    """Test that repeat calls on the same source return fresh, equal lists."""
+    source = "from . import a\nimport myapp.core\n"
+    first = extract_python_import_modules(source, internal_prefixes={"myapp"})
+    first.append("mutated")
+    second = extract_python_import_modules(source, internal_prefixes={"myapp"})
+    assert second == [".", "myapp.core"]
+
+    # Same source with different prefixes is not served from the same entry
+    assert extract_python_import_modules(source, internal_prefixes=None) == ["."]
+
+
+def test_syntax_error_raised_on_every_call():
+    """Test that syntax errors are not cached as results."""
+    source = "def bad(:\n  pass"
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            extract_python_import_modules(source, internal_prefixes=None)
@@ -235,3 +235,11 @@ def test_string_escape_sequences():
     result = extract_tsjs_import_specifiers(source, internal_prefixes=None)
     assert result == ["./a"]
 
+
+def test_import_keyword_inside_matched_import_not_rescanned():
+    """Test that an import form found inside a previous match of the same form is skipped."""
+    # The ESM match spans `import 'import\n"`; the inner "import" starts
+    # inside it, so "./m" is not an import specifier
+    source = "import 'import\n\"./m\""
+    result = extract_tsjs_import_specifiers(source, internal_prefixes=None)
+    assert result == []
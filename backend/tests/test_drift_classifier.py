@@ -388,6 +388,35 @@ def test_count_extraction_fallback():
     assert result["summary"]["cycles_added_count"] == 0
 
 
+def test_count_extraction_fallback_when_counts_none():
+    """Test that count extraction uses len() fallback when counts is None."""
+    analysis = {
+        "compare": {
+            "edges_added": [{"from": "ui", "to": "core"}],
+            "edges_removed": [],
+            "counts": None,
+        },
+        "rules": {
+            "forbidden_edges_added": [{"from": "ui", "to": "core"}],
+            "forbidden_edges_removed": [],
+            "counts": None,
+            "error": None,
+        },
+        "cycles": {
+            "cycles_added": [],
+            "cycles_removed": [],
+            "counts": None,
+        },
+    }
+
+    result = classify_drift(analysis)
+
+    assert result["classification"] == "negative"
+    assert result["summary"]["edges_added_count"] == 1
+    assert result["summary"]["forbidden_edges_added_count"] == 1
+    assert result["summary"]["cycles_added_count"] == 0
+
+
 def test_multiple_missing_components():
     """Test that multiple missing components combine reason_codes."""
     analysis = {
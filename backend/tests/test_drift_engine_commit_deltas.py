@@ -51,10 +51,17 @@ def _write_config(tmp_path: Path):
     return cfg_dir
 
 
+@pytest.fixture(scope="module")
+def cfg_dir(tmp_path_factory):
+    """Architecture config files written once per module; tests only read them."""
+    return _write_config(tmp_path_factory.mktemp("config"))
+
+
 def _init_repo(tmp_path: Path) -> Repo:
     repo = Repo.init(tmp_path)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     return repo
 
 
@@ -64,13 +71,15 @@ def _commit(repo: Repo, message: str):
     return repo.head.commit
 
 
-def _set_env(monkeypatch, mode: str):
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", mode)
+@pytest.fixture(autouse=True)
+def conformance_env(monkeypatch, cfg_dir):
+    """Run in conformance mode against the shared architecture config dir."""
+    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
+    monkeypatch.setattr("utils.architecture_config._get_default_config_dir", lambda: cfg_dir)
 
 
 def test_keywords_mode_regression(monkeypatch, tmp_path):
-    _set_env(monkeypatch, "keywords")
-    cfg_dir = _write_config(tmp_path)
+    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "keywords")
     repo = _init_repo(tmp_path / "repo")
     (tmp_path / "repo" / "ui").mkdir(parents=True, exist_ok=True)
     (tmp_path / "repo" / "core").mkdir(parents=True, exist_ok=True)
@@ -84,10 +93,7 @@ def test_keywords_mode_regression(monkeypatch, tmp_path):
     assert d.type == "positive"
 
 
-def test_conformance_per_commit_negative_and_positive(monkeypatch, tmp_path):
-    _set_env(monkeypatch, "conformance")
-    cfg_dir = _write_config(tmp_path)
-    monkeypatch.setattr("utils.architecture_config._get_default_config_dir", lambda: cfg_dir)
+def test_conformance_per_commit_negative_and_positive(monkeypatch, tmp_path, cfg_dir):
     repo_root = tmp_path / "repo"
     repo = _init_repo(repo_root)
     data_dir = tmp_path / "data"
@@ -134,10 +140,7 @@ def test_conformance_per_commit_negative_and_positive(monkeypatch, tmp_path):
     assert drift_c.edges_removed_count >= 0
 
 
-def test_conformance_no_change_commit(monkeypatch, tmp_path):
-    _set_env(monkeypatch, "conformance")
-    cfg_dir = _write_config(tmp_path)
-    monkeypatch.setattr("utils.architecture_config._get_default_config_dir", lambda: cfg_dir)
+def test_conformance_no_change_commit(monkeypatch, tmp_path, cfg_dir):
     repo_root = tmp_path / "repo"
     repo = _init_repo(repo_root)
     data_dir = tmp_path / "data"
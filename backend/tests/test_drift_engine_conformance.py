@@ -17,6 +17,25 @@ from utils.baseline_store import store_baseline
 from utils.architecture_config import _get_default_config_dir
 
 
+# Stub dependency graphs, shared across calls; the engine only reads them
+_FORBIDDEN_GRAPH = {
+    "edges": [{"from": "ui", "to": "core"}],
+    "scanned_files": 2,
+    "included_files": 2,
+    "skipped_files": 0,
+    "unmapped_files": 0,
+    "unresolved_imports": 0,
+}
+_CYCLE_GRAPH = {
+    "edges": [{"from": "ui", "to": "ui"}, {"from": "core", "to": "ui"}],
+    "scanned_files": 2,
+    "included_files": 2,
+    "skipped_files": 0,
+    "unmapped_files": 0,
+    "unresolved_imports": 0,
+}
+
+
 def _write_architecture_config(tmpdir: Path):
     """Create architecture config files in tmpdir/architecture."""
     config_dir = tmpdir / "architecture"
@@ -79,12 +98,20 @@ def _make_repo_with_edge(tmp_path: Path, edge_type: str | None = None) -> Path:
     return repo
 
 
+@pytest.fixture(scope="module")
+def architecture_config_dir(tmp_path_factory):
+    """Architecture config files written once per module; tests only read them."""
+    return _write_architecture_config(tmp_path_factory.mktemp("arch"))
+
+
 @pytest.fixture(autouse=True)
-def patch_config_dir(monkeypatch, tmp_path):
-    """Patch architecture config directory to use tmp_path."""
-    config_dir = _write_architecture_config(tmp_path)
-    monkeypatch.setattr("utils.architecture_config._get_default_config_dir", lambda: config_dir)
-    return config_dir
+def conformance_env(monkeypatch, architecture_config_dir):
+    """Run in conformance mode against the shared architecture config dir."""
+    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
+    monkeypatch.setattr(
+        "utils.architecture_config._get_default_config_dir", lambda: architecture_config_dir
+    )
+    return architecture_config_dir
 
 
 @pytest.fixture
@@ -119,22 +146,11 @@ def test_keywords_mode_unchanged(monkeypatch, commit_stub):
 
 def test_conformance_forbidden_edge_negative(monkeypatch, tmp_path, commit_stub):
     """Test conformance mode: forbidden edge added -> negative classification."""
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-    
     repo = _make_repo_with_edge(tmp_path, "forbidden")
 
     # Force dependency graph to include forbidden edge ui->core
-    from services import drift_engine as de
     monkeypatch.setattr(
-        "services.drift_engine.build_dependency_graph",
-        lambda repo_root, config: {
-            "edges": [{"from": "ui", "to": "core"}],
-            "scanned_files": 2,
-            "included_files": 2,
-            "skipped_files": 0,
-            "unmapped_files": 0,
-            "unresolved_imports": 0,
-        },
+        "services.drift_engine.build_dependency_graph", lambda repo_root, config: _FORBIDDEN_GRAPH
     )
     
     # Create baseline with no edges
@@ -152,8 +168,6 @@ def test_conformance_forbidden_edge_negative(monkeypatch, tmp_path, commit_stub)
 
 def test_conformance_missing_baseline_unknown(monkeypatch, tmp_path, commit_stub):
     """Test conformance mode: missing baseline -> unknown classification."""
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-    
     repo = _make_repo_with_edge(tmp_path, None)
     
     # No baseline created
@@ -169,21 +183,11 @@ def test_conformance_missing_baseline_unknown(monkeypatch, tmp_path, commit_stub
 
 def test_conformance_cycle_added(monkeypatch, tmp_path, commit_stub):
     """Test conformance mode: cycle added -> negative classification."""
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-    
     repo = _make_repo_with_edge(tmp_path, "cycle")
 
     # Force dependency graph to include a cycle a->b, b->a
     monkeypatch.setattr(
-        "services.drift_engine.build_dependency_graph",
-        lambda repo_root, config: {
-            "edges": [{"from": "ui", "to": "ui"}, {"from": "core", "to": "ui"}],
-            "scanned_files": 2,
-            "included_files": 2,
-            "skipped_files": 0,
-            "unmapped_files": 0,
-            "unresolved_imports": 0,
-        },
+        "services.drift_engine.build_dependency_graph", lambda repo_root, config: _CYCLE_GRAPH
     )
     
     # Create baseline with no edges
@@ -201,8 +205,6 @@ def test_conformance_cycle_added(monkeypatch, tmp_path, commit_stub):
 
 def test_conformance_non_architecture_uses_keywords(monkeypatch, tmp_path):
     """Test that non-architecture drifts use keywords even in conformance mode."""
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-    
     # Commit with API contract drift type (not architecture)
     api_commit = [
         {
@@ -226,8 +228,6 @@ def test_conformance_non_architecture_uses_keywords(monkeypatch, tmp_path):
 
 def test_evidence_preview_from_forbidden_edges(monkeypatch, tmp_path):
     """Test that evidence_preview is populated from forbidden edges matched against evidence."""
-    monkeypatch.setenv("DRIFT_CLASSIFIER_MODE", "conformance")
-    
     repo = _make_repo_with_edge(tmp_path, "forbidden")
     
     # Create baseline with at least one edge so readiness check passes
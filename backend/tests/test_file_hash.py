@@ -0,0 +1,25 @@
+"""Tests for file hashing utilities."""
+
+import hashlib
+
+import pytest
+
+from utils.file_hash import file_sha256
+
+
+@pytest.mark.parametrize("use_file_digest", [True, False])
+def test_file_sha256_matches_hashlib(tmp_path, monkeypatch, use_file_digest):
+    """Test that the digest matches hashlib.sha256 over the bytes, with and without file_digest."""
+    if not use_file_digest:
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    data = b"module map\n" * 200_000
+    path = tmp_path / "module_map.json"
+    path.write_bytes(data)
+
+    assert file_sha256(path) == hashlib.sha256(data).hexdigest()
+
+
+def test_file_sha256_missing_file_raises(tmp_path):
+    """Test that a missing file raises OSError."""
+    with pytest.raises(OSError):
+        file_sha256(tmp_path / "missing.json")
@@ -5,6 +5,7 @@ from pathlib import Path
 import pytest
 from git import Repo
 
+from utils import git_commit_graph
 from utils.git_commit_graph import build_commit_delta, Limits
 from utils.architecture_config import ArchitectureConfig, ModuleSpec, AllowedEdge, ExceptionEdge
 
@@ -22,8 +23,9 @@ def _config():
 
 def _init_repo(tmp_path: Path) -> Repo:
     repo = Repo.init(tmp_path)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     return repo
 
 
@@ -93,6 +95,29 @@ def test_binary_file_skipped(tmp_path):
     assert result["stats"]["files_skipped_binary"] > 0
 
 
+def test_large_and_late_binary_files_skipped(tmp_path):
+    repo = _init_repo(tmp_path)
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "ui" / "big.py").write_text("from core import svc\n" * 100, encoding="utf-8")
+    # NUL past the peeked prefix still marks the file as binary
+    (tmp_path / "ui" / "late.py").write_bytes(b"from core import svc\n" * 1000 + b"\x00")
+    commit = _commit(repo, "large and binary files")
+
+    result = build_commit_delta(
+        str(tmp_path), commit.hexsha, _config(), Limits(max_bytes_per_file=30_000)
+    )
+    assert result["edges_added"] == [{"from": "ui", "to": "core"}]
+    assert result["stats"]["files_skipped_too_large"] == 0
+    assert result["stats"]["files_skipped_binary"] == 1
+
+    result = build_commit_delta(
+        str(tmp_path), commit.hexsha, _config(), Limits(max_bytes_per_file=1_000)
+    )
+    assert result["edges_added_count"] == 0
+    assert result["stats"]["files_skipped_too_large"] == 2
+    assert result["stats"]["files_skipped_binary"] == 0
+
+
 def test_rename_changes_from_module(tmp_path):
     repo = _init_repo(tmp_path)
     (tmp_path / "ui").mkdir()
@@ -129,3 +154,82 @@ def test_deterministic_output(tmp_path):
     assert result1["edges_added"] == result2["edges_added"]
     assert result1["evidence"] == result2["evidence"]
 
+
+def test_blob_imports_reused_across_commits(tmp_path, monkeypatch):
+    repo = _init_repo(tmp_path)
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "core").mkdir()
+    (tmp_path / "ui" / "app.py").write_text("from core import svc\n", encoding="utf-8")
+    first = _commit(repo, "add import")
+    (tmp_path / "ui" / "app.py").write_text("pass\n", encoding="utf-8")
+    second = _commit(repo, "remove import")
+
+    read_blobs = []
+    original_read = git_commit_graph._read_blob_text
+
+    def counting_read(blob, limits):
+        read_blobs.append(blob.hexsha)
+        return original_read(blob, limits)
+
+    git_commit_graph._blob_imports_cache.clear()
+    monkeypatch.setattr(git_commit_graph, "_read_blob_text", counting_read)
+
+    build_commit_delta(str(tmp_path), first.hexsha, _config(), Limits())
+    result = build_commit_delta(str(tmp_path), second.hexsha, _config(), Limits())
+
+    # The first commit's blob is the second commit's parent side: read once
+    assert len(read_blobs) == len(set(read_blobs)) == 2
+    assert result["edges_removed"] == [{"from": "ui", "to": "core"}]
+
+
+def test_blob_read_error_not_cached():
+    class _Stream:
+        size = 20
+
+        def __init__(self, data):
+            self._data = data
+
+        def read(self, n=-1):
+            chunk, self._data = self._data[:n], self._data[n:]
+            return chunk
+
+    class _FlakyBlob:
+        binsha = b"\x01" * 20
+        reads = 0
+
+        @property
+        def data_stream(self):
+            self.reads += 1
+            if self.reads == 1:
+                raise OSError("git cat-file died")
+            return _Stream(b"from core import svc\n")
+
+    git_commit_graph._blob_imports_cache.clear()
+    blob = _FlakyBlob()
+
+    # The failed read is reported but not pinned for the blob id
+    prefixes = {"ui", "core"}
+    assert git_commit_graph._blob_imports(blob, "ui/app.py", prefixes, Limits()) == (None, "read_error")
+    imports, reason = git_commit_graph._blob_imports(blob, "ui/app.py", prefixes, Limits())
+    assert blob.reads == 2
+    assert imports == ["core"]
+    assert reason is None
+
+
+def test_unmapped_unparsable_file_ignored(tmp_path):
+    repo = _init_repo(tmp_path)
+    (tmp_path / "ui").mkdir()
+    (tmp_path / "core").mkdir()
+    (tmp_path / "scripts").mkdir()
+    (tmp_path / "ui" / "app.py").write_text("pass\n", encoding="utf-8")
+    first = _commit(repo, "init")
+
+    # A Python 2 script outside every module must not be parsed
+    (tmp_path / "scripts" / "legacy.py").write_text("print 'hello'\n", encoding="utf-8")
+    (tmp_path / "ui" / "app.py").write_text("from core import svc\n", encoding="utf-8")
+    second = _commit(repo, "add legacy script and import")
+
+    result = build_commit_delta(str(tmp_path), second.hexsha, _config(), Limits())
+    assert result["parent"] == first.hexsha
+    assert result["edges_added"] == [{"from": "ui", "to": "core"}]
+    assert result["stats"]["changed_files_considered"] == 2
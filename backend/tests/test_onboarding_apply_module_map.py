@@ -6,21 +6,27 @@ persists a module_map.json file server-side and returns the config_dir path.
 
 import hashlib
 import json
-import shutil
 from pathlib import Path
 
-import pytest
-from fastapi.testclient import TestClient
 from git import Repo
 
-from main import app
 
+# Module map written by the tests, with its canonical bytes and their SHA-256
+MODULE_MAP = {
+    "version": "1.0",
+    "unmapped_module_id": "unmapped",
+    "modules": [
+        {"id": "src_core", "roots": ["src/core"]}
+    ]
+}
+MODULE_MAP_BYTES = json.dumps(MODULE_MAP, indent=2, sort_keys=True).encode("utf-8")
+EXPECTED_SHA256 = hashlib.sha256(MODULE_MAP_BYTES).hexdigest()
 
-def test_onboarding_apply_module_map(tmp_path):
+
+def test_onboarding_apply_module_map(tmp_path, onboarding_dir, client, hex_digits):
     """Test POST /onboarding/apply-module-map with a local git repository."""
     # Create a temporary directory for the test repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -30,29 +36,20 @@ def test_onboarding_apply_module_map(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Commit at least one file
     repo.git.add("--all")
     repo.index.commit("Initial commit")
     
-    # Define module_map
-    module_map = {
-        "version": "1.0",
-        "unmapped_module_id": "unmapped",
-        "modules": [
-            {"id": "src_core", "roots": ["src/core"]}
-        ]
-    }
-    
     # Call the endpoint
-    client = TestClient(app)
     response = client.post(
         "/onboarding/apply-module-map",
         json={
             "repo_path": str(repo_root),
-            "module_map": module_map,
+            "module_map": MODULE_MAP,
             "config_label": "suggested_v1"
         },
     )
@@ -63,7 +60,7 @@ def test_onboarding_apply_module_map(tmp_path):
     # Assert response JSON has required keys
     data = response.json()
     required_keys = {"repo_path", "repo_id", "config_dir", "module_map_path", "module_map_sha256", "notes"}
-    assert set(data.keys()) == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
+    assert data.keys() == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
     
     # Assert repo_path matches input
     assert data["repo_path"] == str(repo_root), "repo_path should match input"
@@ -71,7 +68,7 @@ def test_onboarding_apply_module_map(tmp_path):
     # Assert repo_id is 12 characters hex
     assert isinstance(data["repo_id"], str), "repo_id should be a string"
     assert len(data["repo_id"]) == 12, "repo_id should be 12 characters"
-    assert all(c in "0123456789abcdef" for c in data["repo_id"]), "repo_id should be hexadecimal"
+    assert set(data["repo_id"]) <= hex_digits, "repo_id should be hexadecimal"
     
     # Assert config_dir exists
     config_dir = Path(data["config_dir"])
@@ -90,13 +87,11 @@ def test_onboarding_apply_module_map(tmp_path):
     with open(module_map_path, "r", encoding="utf-8") as f:
         saved_module_map = json.load(f)
     
-    assert saved_module_map == module_map, "Saved module_map should equal input module_map"
+    assert saved_module_map == MODULE_MAP, "Saved module_map should equal input module_map"
     
-    # Assert module_map_sha256 matches sha256 of file bytes
-    with open(module_map_path, "rb") as f:
-        file_bytes = f.read()
-    expected_sha256 = hashlib.sha256(file_bytes).hexdigest()
-    assert data["module_map_sha256"] == expected_sha256, f"module_map_sha256 should match computed SHA256: {data['module_map_sha256']} != {expected_sha256}"
+    # Assert the file holds the canonical bytes and module_map_sha256 is their SHA256
+    assert module_map_path.read_bytes() == MODULE_MAP_BYTES, "module_map.json should be canonical JSON"
+    assert data["module_map_sha256"] == EXPECTED_SHA256, f"module_map_sha256 should match computed SHA256: {data['module_map_sha256']} != {EXPECTED_SHA256}"
     
     # Assert notes
     assert isinstance(data["notes"], list), "notes should be a list"
@@ -107,16 +102,5 @@ def test_onboarding_apply_module_map(tmp_path):
     repo_module_map = repo_root / "module_map.json"
     assert not repo_module_map.exists(), "module_map.json should not exist in repo root"
     
-    # Cleanup: delete the created config_dir
-    if config_dir.exists():
-        # Find backend directory
-        backend_dir = Path(__file__).parent.parent
-        onboarding_dir = backend_dir / ".onboarding"
-        if onboarding_dir.exists():
-            # Only delete the specific repo_id/label dir created by this test
-            configs_dir = onboarding_dir / "configs"
-            if configs_dir.exists():
-                repo_id_dir = configs_dir / data["repo_id"]
-                if repo_id_dir.exists():
-                    shutil.rmtree(repo_id_dir, ignore_errors=True)
-
+    # Assert config is stored under the onboarding directory, not backend/
+    assert config_dir.is_relative_to(onboarding_dir.resolve()), f"config_dir should be under {onboarding_dir}"
@@ -9,51 +9,33 @@ import json
 import shutil
 from pathlib import Path
 
-import pytest
-from fastapi.testclient import TestClient
-from git import Repo
 
-from main import app
+# Module map written by the tests, with its canonical bytes and their SHA-256
+MODULE_MAP = {
+    "version": "1.0",
+    "unmapped_module_id": "unmapped",
+    "modules": [
+        {"id": "src_core", "roots": ["src/core"]}
+    ]
+}
+MODULE_MAP_BYTES = json.dumps(MODULE_MAP, indent=2, sort_keys=True).encode("utf-8")
+EXPECTED_SHA256 = hashlib.sha256(MODULE_MAP_BYTES).hexdigest()
 
 
-def test_onboarding_arch_snapshot_create_happy_path(tmp_path):
+def test_onboarding_arch_snapshot_create_happy_path(tmp_path, git_template, client, hex_digits):
     """Test POST /onboarding/architecture-snapshot/create creates snapshot successfully."""
-    # Create a temporary directory for the test repository
+    # Copy the committed template repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
-    
-    # Create directory structure
-    (repo_root / "src" / "core").mkdir(parents=True)
-    
-    # Create test file
-    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
-    
-    # Initialize git repository
-    repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
-    
-    # Commit at least one file
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
+    shutil.copytree(git_template, repo_root)
     
     # Create config_dir with module_map.json
     config_dir = tmp_path / "config"
     config_dir.mkdir()
     
-    module_map = {
-        "version": "1.0",
-        "unmapped_module_id": "unmapped",
-        "modules": [
-            {"id": "src_core", "roots": ["src/core"]}
-        ]
-    }
     module_map_path = config_dir / "module_map.json"
-    with open(module_map_path, "w", encoding="utf-8") as f:
-        json.dump(module_map, f, indent=2, sort_keys=True)
+    module_map_path.write_bytes(MODULE_MAP_BYTES)
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.post(
         "/onboarding/architecture-snapshot/create",
         json={
@@ -81,7 +63,7 @@ def test_onboarding_arch_snapshot_create_happy_path(tmp_path):
         "created_at_utc",
         "is_new",
     }
-    assert set(data.keys()) == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
+    assert data.keys() == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
     
     # Assert repo_path matches input
     assert data["repo_path"] == str(repo_root), "repo_path should match input"
@@ -89,12 +71,12 @@ def test_onboarding_arch_snapshot_create_happy_path(tmp_path):
     # Assert repo_id is 12 characters hex
     assert isinstance(data["repo_id"], str), "repo_id should be a string"
     assert len(data["repo_id"]) == 12, "repo_id should be 12 characters"
-    assert all(c in "0123456789abcdef" for c in data["repo_id"]), "repo_id should be hexadecimal"
+    assert set(data["repo_id"]) <= hex_digits, "repo_id should be hexadecimal"
     
     # Assert snapshot_id is 16 characters hex
     assert isinstance(data["snapshot_id"], str), "snapshot_id should be a string"
     assert len(data["snapshot_id"]) == 16, "snapshot_id should be 16 characters"
-    assert all(c in "0123456789abcdef" for c in data["snapshot_id"]), "snapshot_id should be hexadecimal"
+    assert set(data["snapshot_id"]) <= hex_digits, "snapshot_id should be hexadecimal"
     
     # Assert snapshot_dir exists
     snapshot_dir = Path(data["snapshot_dir"])
@@ -107,11 +89,8 @@ def test_onboarding_arch_snapshot_create_happy_path(tmp_path):
     assert snapshot_module_map_path.exists(), f"module_map.json should exist: {snapshot_module_map_path}"
     assert metadata_path.exists(), f"metadata.json should exist: {metadata_path}"
     
-    # Assert module_map_sha256 matches computed SHA256
-    with open(module_map_path, "rb") as f:
-        file_bytes = f.read()
-    expected_sha256 = hashlib.sha256(file_bytes).hexdigest()
-    assert data["module_map_sha256"] == expected_sha256, f"module_map_sha256 should match computed SHA256: {data['module_map_sha256']} != {expected_sha256}"
+    # Assert module_map_sha256 matches the SHA256 of the written bytes
+    assert data["module_map_sha256"] == EXPECTED_SHA256, f"module_map_sha256 should match computed SHA256: {data['module_map_sha256']} != {EXPECTED_SHA256}"
     
     # Assert metadata.json fields match request and computed values
     with open(metadata_path, "r", encoding="utf-8") as f:
@@ -138,44 +117,20 @@ def test_onboarding_arch_snapshot_create_happy_path(tmp_path):
     assert data["baseline_hash"] is None, "baseline_hash should be None when baseline doesn't exist"
 
 
-def test_onboarding_arch_snapshot_create_idempotent(tmp_path):
+def test_onboarding_arch_snapshot_create_idempotent(tmp_path, git_template, client):
     """Test that calling the endpoint again with same content returns same snapshot_id and is_new=false."""
-    # Create a temporary directory for the test repository
+    # Copy the committed template repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
-    
-    # Create directory structure
-    (repo_root / "src" / "core").mkdir(parents=True)
-    
-    # Create test file
-    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
-    
-    # Initialize git repository
-    repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
-    
-    # Commit at least one file
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
+    shutil.copytree(git_template, repo_root)
     
     # Create config_dir with module_map.json
     config_dir = tmp_path / "config"
     config_dir.mkdir()
     
-    module_map = {
-        "version": "1.0",
-        "unmapped_module_id": "unmapped",
-        "modules": [
-            {"id": "src_core", "roots": ["src/core"]}
-        ]
-    }
     module_map_path = config_dir / "module_map.json"
-    with open(module_map_path, "w", encoding="utf-8") as f:
-        json.dump(module_map, f, indent=2, sort_keys=True)
+    module_map_path.write_bytes(MODULE_MAP_BYTES)
     
     # Call the endpoint first time
-    client = TestClient(app)
     response1 = client.post(
         "/onboarding/architecture-snapshot/create",
         json={
@@ -215,26 +170,11 @@ def test_onboarding_arch_snapshot_create_idempotent(tmp_path):
     assert data2["is_new"] is False, "Second call should have is_new=False"
 
 
-def test_onboarding_arch_snapshot_create_missing_module_map(tmp_path):
+def test_onboarding_arch_snapshot_create_missing_module_map(tmp_path, git_template, client):
     """Test that missing module_map.json returns 400."""
-    # Create a temporary directory for the test repository
+    # Copy the committed template repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
-    
-    # Create directory structure
-    (repo_root / "src" / "core").mkdir(parents=True)
-    
-    # Create test file
-    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
-    
-    # Initialize git repository
-    repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
-    
-    # Commit at least one file
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
+    shutil.copytree(git_template, repo_root)
     
     # Create config_dir WITHOUT module_map.json
     config_dir = tmp_path / "config"
@@ -242,7 +182,6 @@ def test_onboarding_arch_snapshot_create_missing_module_map(tmp_path):
     # Do not create module_map.json
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.post(
         "/onboarding/architecture-snapshot/create",
         json={
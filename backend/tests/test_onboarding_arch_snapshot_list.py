@@ -7,80 +7,61 @@ lists architecture snapshots for a repository, sorted by creation date descendin
 import hashlib
 import json
 import shutil
-from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
-from git import Repo
 
-from main import app
 
+# Metadata for an older (aaaa) and a newer (bbbb) snapshot, serialized once
+_SNAPSHOT_METADATA_BYTES = {
+    snapshot_id: json.dumps(
+        {
+            "snapshot_id": snapshot_id,
+            "created_at_utc": created_at_utc,
+            "snapshot_label": snapshot_label,
+            "created_by": "tester",
+            "note": "n",
+            "module_map_sha256": "h",
+            "rules_hash": None,
+            "baseline_hash": None,
+        },
+        indent=2,
+        sort_keys=True,
+    ).encode("utf-8")
+    for snapshot_id, created_at_utc, snapshot_label in (
+        ("aaaaaaaaaaaaaaaa", "2025-01-01T00:00:00Z", "v1"),
+        ("bbbbbbbbbbbbbbbb", "2025-01-02T00:00:00Z", "v2"),
+    )
+}
 
-def test_list_snapshots_sorted_desc(tmp_path):
-    """Test GET /onboarding/architecture-snapshot/list returns snapshots sorted descending."""
-    # Create a temporary directory for the test repository
+
+@pytest.fixture
+def snapshot_repo(tmp_path, git_template, onboarding_dir):
+    """Copy of the template repository with two snapshots stored for it.
+
+    Returns:
+        Tuple of (repo_root, repo_id).
+    """
+    # Copy the committed template repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
-    
-    # Create directory structure
-    (repo_root / "src" / "core").mkdir(parents=True)
-    
-    # Create test file
-    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
-    
-    # Initialize git repository
-    repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
-    
-    # Commit at least one file
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
-    
+    shutil.copytree(git_template, repo_root)
+
     # Compute repo_id using same algorithm as route
     repo_id = hashlib.sha256(str(repo_root).encode("utf-8")).hexdigest()[:12]
-    
-    # Compute backend_dir the same way routes.py does
-    backend_dir = Path(__file__).parent.parent
-    
-    # Create snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
-    snapshots_root.mkdir(parents=True, exist_ok=True)
-    
-    # Create first snapshot directory (older, aaaa)
-    snapshot_dir_1 = snapshots_root / "aaaaaaaaaaaaaaaa"
-    snapshot_dir_1.mkdir()
-    metadata_1 = {
-        "snapshot_id": "aaaaaaaaaaaaaaaa",
-        "created_at_utc": "2025-01-01T00:00:00Z",
-        "snapshot_label": "v1",
-        "created_by": "tester",
-        "note": "n",
-        "module_map_sha256": "h",
-        "rules_hash": None,
-        "baseline_hash": None,
-    }
-    with open(snapshot_dir_1 / "metadata.json", "w", encoding="utf-8") as f:
-        json.dump(metadata_1, f, indent=2, sort_keys=True)
-    
-    # Create second snapshot directory (newer, bbbb)
-    snapshot_dir_2 = snapshots_root / "bbbbbbbbbbbbbbbb"
-    snapshot_dir_2.mkdir()
-    metadata_2 = {
-        "snapshot_id": "bbbbbbbbbbbbbbbb",
-        "created_at_utc": "2025-01-02T00:00:00Z",
-        "snapshot_label": "v2",
-        "created_by": "tester",
-        "note": "n",
-        "module_map_sha256": "h",
-        "rules_hash": None,
-        "baseline_hash": None,
-    }
-    with open(snapshot_dir_2 / "metadata.json", "w", encoding="utf-8") as f:
-        json.dump(metadata_2, f, indent=2, sort_keys=True)
+
+    # Create one directory per snapshot where the route looks for them
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
+    for snapshot_id, metadata_bytes in _SNAPSHOT_METADATA_BYTES.items():
+        snapshot_dir = snapshots_root / snapshot_id
+        snapshot_dir.mkdir(parents=True)
+        (snapshot_dir / "metadata.json").write_bytes(metadata_bytes)
+    return repo_root, repo_id
+
+
+def test_list_snapshots_sorted_desc(snapshot_repo, client):
+    """Test GET /onboarding/architecture-snapshot/list returns snapshots sorted descending."""
+    repo_root, repo_id = snapshot_repo
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.get(
         "/onboarding/architecture-snapshot/list",
         params={"repo_path": str(repo_root), "limit": 20},
@@ -92,7 +73,7 @@ def test_list_snapshots_sorted_desc(tmp_path):
     # Assert response JSON has required keys
     data = response.json()
     required_keys = {"repo_path", "repo_id", "snapshots"}
-    assert set(data.keys()) == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
+    assert data.keys() == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
     
     # Assert repo_path matches input
     assert data["repo_path"] == str(repo_root), "repo_path should match input"
@@ -120,78 +101,14 @@ def test_list_snapshots_sorted_desc(tmp_path):
         "baseline_hash",
     }
     for snapshot in data["snapshots"]:
-        assert set(snapshot.keys()) == snapshot_keys, f"Snapshot should have exact keys: {snapshot_keys}, got: {set(snapshot.keys())}"
-    
-    # Cleanup: remove only the snapshots_root created for this test
-    if snapshots_root.exists():
-        shutil.rmtree(snapshots_root, ignore_errors=True)
+        assert snapshot.keys() == snapshot_keys, f"Snapshot should have exact keys: {snapshot_keys}, got: {set(snapshot.keys())}"
 
 
-def test_list_snapshots_limit_1(tmp_path):
+def test_list_snapshots_limit_1(snapshot_repo, client):
     """Test GET /onboarding/architecture-snapshot/list respects limit parameter."""
-    # Create a temporary directory for the test repository
-    repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
-    
-    # Create directory structure
-    (repo_root / "src" / "core").mkdir(parents=True)
-    
-    # Create test file
-    (repo_root / "src" / "core" / "a.py").write_text("# core a\n", encoding="utf-8")
-    
-    # Initialize git repository
-    repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
-    
-    # Commit at least one file
-    repo.git.add("--all")
-    repo.index.commit("Initial commit")
-    
-    # Compute repo_id using same algorithm as route
-    repo_id = hashlib.sha256(str(repo_root).encode("utf-8")).hexdigest()[:12]
-    
-    # Compute backend_dir the same way routes.py does
-    backend_dir = Path(__file__).parent.parent
-    
-    # Create snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
-    snapshots_root.mkdir(parents=True, exist_ok=True)
-    
-    # Create first snapshot directory (older, aaaa)
-    snapshot_dir_1 = snapshots_root / "aaaaaaaaaaaaaaaa"
-    snapshot_dir_1.mkdir()
-    metadata_1 = {
-        "snapshot_id": "aaaaaaaaaaaaaaaa",
-        "created_at_utc": "2025-01-01T00:00:00Z",
-        "snapshot_label": "v1",
-        "created_by": "tester",
-        "note": "n",
-        "module_map_sha256": "h",
-        "rules_hash": None,
-        "baseline_hash": None,
-    }
-    with open(snapshot_dir_1 / "metadata.json", "w", encoding="utf-8") as f:
-        json.dump(metadata_1, f, indent=2, sort_keys=True)
-    
-    # Create second snapshot directory (newer, bbbb)
-    snapshot_dir_2 = snapshots_root / "bbbbbbbbbbbbbbbb"
-    snapshot_dir_2.mkdir()
-    metadata_2 = {
-        "snapshot_id": "bbbbbbbbbbbbbbbb",
-        "created_at_utc": "2025-01-02T00:00:00Z",
-        "snapshot_label": "v2",
-        "created_by": "tester",
-        "note": "n",
-        "module_map_sha256": "h",
-        "rules_hash": None,
-        "baseline_hash": None,
-    }
-    with open(snapshot_dir_2 / "metadata.json", "w", encoding="utf-8") as f:
-        json.dump(metadata_2, f, indent=2, sort_keys=True)
+    repo_root, repo_id = snapshot_repo
     
     # Call the endpoint with limit=1
-    client = TestClient(app)
     response = client.get(
         "/onboarding/architecture-snapshot/list",
         params={"repo_path": str(repo_root), "limit": 1},
@@ -207,19 +124,14 @@ def test_list_snapshots_limit_1(tmp_path):
     
     # Assert it's the newest one
     assert data["snapshots"][0]["snapshot_id"] == "bbbbbbbbbbbbbbbb", "With limit=1, should return newest snapshot (bbbb)"
-    
-    # Cleanup: remove only the snapshots_root created for this test
-    if snapshots_root.exists():
-        shutil.rmtree(snapshots_root, ignore_errors=True)
 
 
-def test_list_snapshots_invalid_repo_path_400(tmp_path):
+def test_list_snapshots_invalid_repo_path_400(tmp_path, client):
     """Test GET /onboarding/architecture-snapshot/list returns 400 for invalid repo_path."""
     # Use a non-existent directory
     non_existent_path = tmp_path / "does_not_exist"
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.get(
         "/onboarding/architecture-snapshot/list",
         params={"repo_path": str(non_existent_path), "limit": 20},
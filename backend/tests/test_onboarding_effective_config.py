@@ -7,22 +7,14 @@ by snapshot_id or by selecting the latest snapshot.
 
 import hashlib
 import json
-import shutil
-from pathlib import Path
 
-import pytest
-from fastapi.testclient import TestClient
 from git import Repo
 
-from main import app
-import api.routes as routes_mod
 
-
-def test_effective_config_by_snapshot_id(tmp_path):
+def test_effective_config_by_snapshot_id(tmp_path, onboarding_dir, client):
     """Test GET /onboarding/effective-config with specific snapshot_id."""
     # Create a temporary directory for the test repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -32,8 +24,9 @@ def test_effective_config_by_snapshot_id(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Commit at least one file
     repo.git.add("--all")
@@ -42,11 +35,8 @@ def test_effective_config_by_snapshot_id(tmp_path):
     # Compute repo_id using same algorithm as route
     repo_id = hashlib.sha256(str(repo_root).encode("utf-8")).hexdigest()[:12]
     
-    # Compute backend_dir using routes module
-    backend_dir = Path(routes_mod.__file__).parent.parent
-    
-    # Create snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
+    # Create snapshots_root where the route looks for it
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
     snapshots_root.mkdir(parents=True, exist_ok=True)
     
     # Create first snapshot directory (aaaa)
@@ -75,7 +65,6 @@ def test_effective_config_by_snapshot_id(tmp_path):
     expected_sha256 = hashlib.sha256(module_map_bytes).hexdigest()
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.get(
         "/onboarding/effective-config",
         params={"repo_path": str(repo_root), "snapshot_id": "aaaaaaaaaaaaaaaa"},
@@ -98,7 +87,7 @@ def test_effective_config_by_snapshot_id(tmp_path):
         "created_by",
         "note",
     }
-    assert set(data.keys()) == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
+    assert data.keys() == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
     
     # Assert repo_path matches input
     assert data["repo_path"] == str(repo_root), "repo_path should match input"
@@ -114,17 +103,12 @@ def test_effective_config_by_snapshot_id(tmp_path):
     
     # Assert module_map_sha256 matches computed hash
     assert data["module_map_sha256"] == expected_sha256, "module_map_sha256 should match computed hash"
-    
-    # Cleanup: remove only the snapshots_root created for this test
-    if snapshots_root.exists():
-        shutil.rmtree(snapshots_root, ignore_errors=True)
 
 
-def test_effective_config_latest_when_snapshot_id_missing(tmp_path):
+def test_effective_config_latest_when_snapshot_id_missing(tmp_path, onboarding_dir, client):
     """Test GET /onboarding/effective-config without snapshot_id selects latest."""
     # Create a temporary directory for the test repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -134,8 +118,9 @@ def test_effective_config_latest_when_snapshot_id_missing(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Commit at least one file
     repo.git.add("--all")
@@ -144,11 +129,8 @@ def test_effective_config_latest_when_snapshot_id_missing(tmp_path):
     # Compute repo_id using same algorithm as route
     repo_id = hashlib.sha256(str(repo_root).encode("utf-8")).hexdigest()[:12]
     
-    # Compute backend_dir using routes module
-    backend_dir = Path(routes_mod.__file__).parent.parent
-    
-    # Create snapshots_root
-    snapshots_root = backend_dir / ".onboarding" / "snapshots" / repo_id
+    # Create snapshots_root where the route looks for it
+    snapshots_root = onboarding_dir / "snapshots" / repo_id
     snapshots_root.mkdir(parents=True, exist_ok=True)
     
     # Create first snapshot directory (older, aaaa)
@@ -194,7 +176,6 @@ def test_effective_config_latest_when_snapshot_id_missing(tmp_path):
         json.dump(module_map_content, f, indent=2, sort_keys=True)
     
     # Call the endpoint without snapshot_id
-    client = TestClient(app)
     response = client.get(
         "/onboarding/effective-config",
         params={"repo_path": str(repo_root)},
@@ -208,17 +189,12 @@ def test_effective_config_latest_when_snapshot_id_missing(tmp_path):
     
     # Assert snapshot_id is the latest (bbbb)
     assert data["snapshot_id"] == "bbbbbbbbbbbbbbbb", "snapshot_id should be latest (bbbbbbbbbbbbbbbb)"
-    
-    # Cleanup: remove only the snapshots_root created for this test
-    if snapshots_root.exists():
-        shutil.rmtree(snapshots_root, ignore_errors=True)
 
 
-def test_effective_config_invalid_snapshot_id_422(tmp_path):
+def test_effective_config_invalid_snapshot_id_422(tmp_path, client):
     """Test GET /onboarding/effective-config returns 422 for invalid snapshot_id."""
     # Create a temporary directory for the test repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -228,15 +204,15 @@ def test_effective_config_invalid_snapshot_id_422(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Commit at least one file
     repo.git.add("--all")
     repo.index.commit("Initial commit")
     
     # Call the endpoint with invalid snapshot_id
-    client = TestClient(app)
     response = client.get(
         "/onboarding/effective-config",
         params={"repo_path": str(repo_root), "snapshot_id": "BAD"},
@@ -250,11 +226,10 @@ def test_effective_config_invalid_snapshot_id_422(tmp_path):
     assert "16 lowercase hex" in error_detail.lower(), f"Error message should mention 16 lowercase hex chars: {error_detail}"
 
 
-def test_effective_config_no_snapshots_404(tmp_path):
+def test_effective_config_no_snapshots_404(tmp_path, client):
     """Test GET /onboarding/effective-config returns 404 when no snapshots exist."""
     # Create a temporary directory for the test repository (different from other tests)
     repo_root = tmp_path / "test_repo_no_snapshots"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -264,8 +239,9 @@ def test_effective_config_no_snapshots_404(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Commit at least one file
     repo.git.add("--all")
@@ -274,7 +250,6 @@ def test_effective_config_no_snapshots_404(tmp_path):
     # Do NOT create snapshots_root - it should not exist
     
     # Call the endpoint
-    client = TestClient(app)
     response = client.get(
         "/onboarding/effective-config",
         params={"repo_path": str(repo_root)},
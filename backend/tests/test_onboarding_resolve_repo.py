@@ -22,8 +22,9 @@ def test_onboarding_resolve_repo(tmp_path):
 
     # Initialize git repository
     repo = Repo.init(tmp_repo_dir)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
 
     # Create at least one file and commit it
     test_file = tmp_repo_dir / "test.txt"
@@ -18,7 +18,6 @@ def test_onboarding_suggest_module_map_folder_scan(tmp_path):
     """Test POST /onboarding/suggest-module-map with folder scan method."""
     # Create a temporary directory for the test repository
     repo_root = tmp_path / "test_repo"
-    repo_root.mkdir()
     
     # Create directory structure
     (repo_root / "src" / "core").mkdir(parents=True)
@@ -35,8 +34,9 @@ def test_onboarding_suggest_module_map_folder_scan(tmp_path):
     
     # Initialize git repository
     repo = Repo.init(repo_root)
-    repo.config_writer().set_value("user", "name", "Tester").release()
-    repo.config_writer().set_value("user", "email", "tester@example.com").release()
+    with repo.config_writer() as writer:
+        writer.set_value("user", "name", "Tester")
+        writer.set_value("user", "email", "tester@example.com")
     
     # Create at least one file and commit it
     test_file = repo_root / "src" / "core" / "a.py"
@@ -56,7 +56,7 @@ def test_onboarding_suggest_module_map_folder_scan(tmp_path):
     # Assert response JSON has required keys
     data = response.json()
     required_keys = {"repo_path", "suggestion_method", "buckets", "module_map_suggestion", "notes"}
-    assert set(data.keys()) == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
+    assert data.keys() == required_keys, f"Response should have exact keys: {required_keys}, got: {set(data.keys())}"
     
     # Assert suggestion_method
     assert data["suggestion_method"] == "folder_scan", "suggestion_method should be 'folder_scan'"
@@ -6,14 +6,15 @@ This module loads and validates architecture configuration files:
 - exceptions.json: Defines temporary exceptions to rules
 """
 
+import functools
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModuleSpec:
     """Specification for a module with its file path roots."""
 
@@ -21,7 +22,7 @@ class ModuleSpec:
     roots: list[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AllowedEdge:
     """Allowed dependency edge between modules."""
 
@@ -29,7 +30,7 @@ class AllowedEdge:
     to_module: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExceptionEdge:
     """Exception to dependency rules."""
 
@@ -40,7 +41,7 @@ class ExceptionEdge:
     expires_on: Optional[date] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ArchitectureConfig:
     """Complete architecture configuration."""
 
@@ -50,6 +51,9 @@ class ArchitectureConfig:
     deny_by_default: bool
     allowed_edges: list[AllowedEdge]
     exceptions: list[ExceptionEdge]
+    # Normalized root -> module ID index, built by utils.architecture_mapper
+    # on the first path lookup; not part of the configuration's value
+    _root_index: dict[str, str] | None = field(default=None, init=False, repr=False, compare=False)
 
 
 def _get_default_config_dir() -> Path:
@@ -58,27 +62,41 @@ def _get_default_config_dir() -> Path:
     return backend_dir / "architecture"
 
 
-def _load_json_file(file_path: Path, file_name: str) -> dict:
-    """Load and parse a JSON file.
+def _read_config_file(file_path: Path, file_name: str) -> bytes:
+    """Read the raw bytes of a configuration file.
 
     Args:
         file_path: Path to the JSON file.
         file_name: Name of the file (for error messages).
 
     Returns:
-        Parsed JSON dictionary.
+        Raw file contents.
 
     Raises:
-        ValueError: If file is missing or contains invalid JSON.
+        ValueError: If file is missing.
     """
     if not file_path.exists():
         raise ValueError(
             f"Missing configuration file '{file_name}' at expected path: {file_path}"
         )
+    return file_path.read_bytes()
+
+
+def _parse_json_bytes(raw: bytes, file_name: str) -> dict:
+    """Parse JSON from raw UTF-8 file contents.
+
+    Args:
+        raw: Raw file contents.
+        file_name: Name of the file (for error messages).
 
+    Returns:
+        Parsed JSON dictionary.
+
+    Raises:
+        ValueError: If the contents are not valid JSON.
+    """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(raw.decode("utf-8"))
     except json.JSONDecodeError as e:
         raise ValueError(
             f"Invalid JSON in '{file_name}': {e.msg} at line {e.lineno}, column {e.colno}"
@@ -413,39 +431,32 @@ def _cross_validate_module_ids(
             )
 
 
-def load_architecture_config(config_dir: Optional[Path] = None) -> ArchitectureConfig:
-    """Load and validate architecture configuration files.
-
-    Args:
-        config_dir: Optional directory containing config files. If None, uses default
-            backend/architecture directory.
+@functools.lru_cache(maxsize=32)
+def _build_architecture_config(
+    module_map_raw: bytes,
+    allowed_rules_raw: bytes,
+    exceptions_raw: bytes,
+) -> ArchitectureConfig:
+    """Parse and validate architecture config from raw file contents.
 
-    Returns:
-        ArchitectureConfig object with all loaded and validated data.
-
-    Raises:
-        ValueError: If any file is missing, contains invalid JSON, or has invalid structure.
+    Cached on the file contents, so repeated loads of unchanged config files
+    (e.g. once per analyzed commit) skip JSON parsing and validation. Errors
+    are raised, not cached.
     """
-    if config_dir is None:
-        config_dir = _get_default_config_dir()
-
-    # Load module_map.json
-    module_map_path = config_dir / "module_map.json"
-    module_map_data = _load_json_file(module_map_path, "module_map.json")
+    # Parse module_map.json
+    module_map_data = _parse_json_bytes(module_map_raw, "module_map.json")
     version, unmapped_module_id, modules = _validate_module_map(
         module_map_data, "module_map.json"
     )
 
-    # Load allowed_rules.json
-    allowed_rules_path = config_dir / "allowed_rules.json"
-    allowed_rules_data = _load_json_file(allowed_rules_path, "allowed_rules.json")
+    # Parse allowed_rules.json
+    allowed_rules_data = _parse_json_bytes(allowed_rules_raw, "allowed_rules.json")
     rules_version, deny_by_default, allowed_edges = _validate_allowed_rules(
         allowed_rules_data, "allowed_rules.json"
     )
 
-    # Load exceptions.json
-    exceptions_path = config_dir / "exceptions.json"
-    exceptions_data = _load_json_file(exceptions_path, "exceptions.json")
+    # Parse exceptions.json
+    exceptions_data = _parse_json_bytes(exceptions_raw, "exceptions.json")
     exc_version, exceptions = _validate_exceptions(exceptions_data, "exceptions.json")
 
     # Cross-validate module IDs
@@ -461,3 +472,31 @@ def load_architecture_config(config_dir: Optional[Path] = None) -> ArchitectureC
         exceptions=exceptions,
     )
 
+
+def load_architecture_config(config_dir: Optional[Path] = None) -> ArchitectureConfig:
+    """Load and validate architecture configuration files.
+
+    Parsed configs are cached by file content and shared between callers.
+    The config classes are frozen; use dataclasses.replace() for a variant,
+    and do not mutate the module, edge or exception lists in place.
+
+    Args:
+        config_dir: Optional directory containing config files. If None, uses default
+            backend/architecture directory.
+
+    Returns:
+        ArchitectureConfig object with all loaded and validated data.
+
+    Raises:
+        ValueError: If any file is missing, contains invalid JSON, or has invalid structure.
+    """
+    if config_dir is None:
+        config_dir = _get_default_config_dir()
+
+    module_map_raw = _read_config_file(config_dir / "module_map.json", "module_map.json")
+    allowed_rules_raw = _read_config_file(
+        config_dir / "allowed_rules.json", "allowed_rules.json"
+    )
+    exceptions_raw = _read_config_file(config_dir / "exceptions.json", "exceptions.json")
+
+    return _build_architecture_config(module_map_raw, allowed_rules_raw, exceptions_raw)
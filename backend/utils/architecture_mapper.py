@@ -6,7 +6,7 @@ architecture configuration module roots.
 
 from pathlib import Path
 
-from utils.architecture_config import ArchitectureConfig
+from utils.architecture_config import ArchitectureConfig, ModuleSpec
 
 
 def normalize_repo_path(p: str | Path) -> str:
@@ -42,11 +42,57 @@ def normalize_repo_path(p: str | Path) -> str:
     return path_str
 
 
+def _build_root_index(modules: list[ModuleSpec]) -> dict[str, str]:
+    """Build a normalized root -> module ID index for a module configuration.
+
+    If several modules declare the same root, the first one wins.
+
+    Args:
+        modules: Module specifications in configuration order.
+
+    Returns:
+        Dictionary mapping each normalized root to its module ID.
+
+    Raises:
+        ValueError: If a root is empty or invalid type.
+    """
+    root_index: dict[str, str] = {}
+    for module in modules:
+        for root in module.roots:
+            # Validate root
+            if not isinstance(root, str):
+                raise ValueError(
+                    f"Invalid root type in module '{module.id}': expected str, got {type(root).__name__}"
+                )
+            if not root:
+                raise ValueError(f"Empty root string in module '{module.id}'")
+
+            root_index.setdefault(normalize_repo_path(root), module.id)
+    return root_index
+
+
+def _get_root_index(module_map: ArchitectureConfig) -> dict[str, str]:
+    """Return the root index held by module_map, building it on first use.
+
+    Raises:
+        ValueError: If a root is empty or invalid type.
+    """
+    root_index = module_map._root_index
+    if root_index is None:
+        root_index = _build_root_index(module_map.modules)
+        # The config is frozen; the index is a private cache slot on it
+        object.__setattr__(module_map, "_root_index", root_index)
+    return root_index
+
+
 def map_path_to_module_id(file_path: str | Path, module_map: ArchitectureConfig) -> str:
     """Map a file path to a module ID based on module roots.
 
     Matches the path against module roots, using the longest matching root
     (most specific match). If no match is found, returns the unmapped_module_id.
+    Roots are indexed once per configuration object (the index is kept on
+    the config), so a lookup costs one dictionary probe per path segment
+    instead of a scan over all roots.
 
     Args:
         file_path: File path to map (string or Path).
@@ -65,38 +111,16 @@ def map_path_to_module_id(file_path: str | Path, module_map: ArchitectureConfig)
     if not module_map.modules:
         return module_map.unmapped_module_id
 
-    # Track best match (longest root)
-    best_match_module_id = None
-    best_root_length = -1
-
-    # Iterate through all modules and their roots
-    for module in module_map.modules:
-        for root in module.roots:
-            # Validate root
-            if not isinstance(root, str):
-                raise ValueError(
-                    f"Invalid root type in module '{module.id}': expected str, got {type(root).__name__}"
-                )
-            if not root:
-                raise ValueError(f"Empty root string in module '{module.id}'")
-
-            # Normalize root
-            normalized_root = normalize_repo_path(root)
-
-            # Check for match: exact match or prefix match
-            if normalized_path == normalized_root:
-                # Exact match
-                root_length = len(normalized_root)
-                if root_length > best_root_length:
-                    best_match_module_id = module.id
-                    best_root_length = root_length
-            elif normalized_path.startswith(normalized_root + "/"):
-                # Prefix match (path starts with root + "/")
-                root_length = len(normalized_root)
-                if root_length > best_root_length:
-                    best_match_module_id = module.id
-                    best_root_length = root_length
-
-    # Return best match or unmapped
-    return best_match_module_id if best_match_module_id is not None else module_map.unmapped_module_id
-
+    root_index = _get_root_index(module_map)
+
+    # Longest matching root wins: try the path itself, then each ancestor
+    # directory from deepest to shallowest (exact match or root + "/" prefix)
+    candidate = normalized_path
+    while True:
+        module_id = root_index.get(candidate)
+        if module_id is not None:
+            return module_id
+        slash = candidate.rfind("/")
+        if slash == -1:
+            return module_map.unmapped_module_id
+        candidate = candidate[:slash]
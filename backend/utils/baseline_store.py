@@ -92,25 +92,20 @@ def compute_baseline_hash_sha256(normalized_edges: list[dict]) -> str:
     return hash_obj.hexdigest()
 
 
-def atomic_write_text(path: Path, text: str) -> None:
-    """Atomically write text to a file.
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Atomically write bytes to a file whose parent directory already exists.
 
-    Creates parent directories if needed, writes to a temporary file first,
-    then atomically replaces the target file.
+    Writes to a temporary sibling file first, then atomically replaces the
+    target file.
 
     Args:
         path: Target file path.
-        text: Text content to write.
+        data: Bytes to write.
     """
-    # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
-
     # Write to temporary file in same directory
-    with tempfile.NamedTemporaryFile(
-        mode="w", encoding="utf-8", dir=path.parent, delete=False
-    ) as tmp_file:
+    with tempfile.NamedTemporaryFile(mode="wb", dir=path.parent, delete=False) as tmp_file:
         tmp_path = Path(tmp_file.name)
-        tmp_file.write(text)
+        tmp_file.write(data)
 
     # Atomically replace target file
     try:
@@ -121,6 +116,21 @@ def atomic_write_text(path: Path, text: str) -> None:
         raise
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """Atomically write text to a file.
+
+    Creates parent directories if needed, writes to a temporary file first,
+    then atomically replaces the target file.
+
+    Args:
+        path: Target file path.
+        text: Text content to write.
+    """
+    # Ensure parent directory exists
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, text.encode("utf-8"))
+
+
 def store_baseline(
     baseline_dir: Path,
     edges: list[dict],
@@ -150,7 +160,8 @@ def store_baseline(
     edges_payload = {"version": "1.0", "edges": normalized}
     edges_json = json.dumps(edges_payload, indent=2, ensure_ascii=True)
     edges_path = baseline_dir / "baseline_edges.json"
-    atomic_write_text(edges_path, edges_json)
+    baseline_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(edges_path, edges_json.encode("utf-8"))
 
     # Write baseline_summary.json
     from datetime import datetime
@@ -182,7 +193,7 @@ def store_baseline(
         summary_payload["health"] = health
     summary_json = json.dumps(summary_payload, indent=2, ensure_ascii=True)
     summary_path = baseline_dir / "baseline_summary.json"
-    atomic_write_text(summary_path, summary_json)
+    atomic_write_bytes(summary_path, summary_json.encode("utf-8"))
 
     return {
         "baseline_dir": str(baseline_dir),
@@ -191,6 +202,35 @@ def store_baseline(
     }
 
 
+def _load_baseline_json(baseline_dir: Path, file_name: str):
+    """Read and decode a baseline JSON file in a single read.
+
+    Args:
+        baseline_dir: Directory containing baseline files.
+        file_name: Name of the file inside baseline_dir.
+
+    Returns:
+        Decoded JSON value.
+
+    Raises:
+        ValueError: If the file is missing or contains invalid JSON.
+    """
+    file_path = baseline_dir / file_name
+    try:
+        raw = file_path.read_bytes()
+    except FileNotFoundError:
+        raise ValueError(
+            f"Missing baseline file '{file_name}' at expected path: {file_path}"
+        ) from None
+
+    try:
+        return json.loads(raw.decode("utf-8"))
+    except json.JSONDecodeError as e:
+        raise ValueError(
+            f"Invalid JSON in '{file_name}': {e.msg} at line {e.lineno}, column {e.colno}"
+        ) from e
+
+
 def load_baseline(baseline_dir: Path) -> dict:
     """Load and validate baseline files from disk.
 
@@ -207,19 +247,7 @@ def load_baseline(baseline_dir: Path) -> dict:
         ValueError: If files are missing, invalid JSON, schema invalid, or hash mismatch.
     """
     # Load baseline_edges.json
-    edges_path = baseline_dir / "baseline_edges.json"
-    if not edges_path.exists():
-        raise ValueError(
-            f"Missing baseline file 'baseline_edges.json' at expected path: {edges_path}"
-        )
-
-    try:
-        with open(edges_path, "r", encoding="utf-8") as f:
-            edges_data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(
-            f"Invalid JSON in 'baseline_edges.json': {e.msg} at line {e.lineno}, column {e.colno}"
-        ) from e
+    edges_data = _load_baseline_json(baseline_dir, "baseline_edges.json")
 
     # Validate baseline_edges.json schema
     if not isinstance(edges_data, dict):
@@ -238,19 +266,7 @@ def load_baseline(baseline_dir: Path) -> dict:
         )
 
     # Load baseline_summary.json
-    summary_path = baseline_dir / "baseline_summary.json"
-    if not summary_path.exists():
-        raise ValueError(
-            f"Missing baseline file 'baseline_summary.json' at expected path: {summary_path}"
-        )
-
-    try:
-        with open(summary_path, "r", encoding="utf-8") as f:
-            summary_data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(
-            f"Invalid JSON in 'baseline_summary.json': {e.msg} at line {e.lineno}, column {e.colno}"
-        ) from e
+    summary_data = _load_baseline_json(baseline_dir, "baseline_summary.json")
 
     # Validate baseline_summary.json schema
     if not isinstance(summary_data, dict):
@@ -0,0 +1,51 @@
+"""Small thread-safe LRU cache for memoizing results by content keys.
+
+functools.lru_cache keys on the call arguments themselves; this cache lets
+callers key on a content identifier (e.g. a digest of source text or a git
+blob id) while computing the value from data that is not part of the key.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class BoundedCache:
+    """Size-bounded, least-recently-used mapping safe to share across threads."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Create an empty cache holding at most maxsize entries.
+
+        Args:
+            maxsize: Maximum number of entries kept.
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key (marking it recently used), or None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def text_digest(text: str) -> bytes:
+    """Return a 16-byte content digest of text, for use in cache keys."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
@@ -54,6 +54,21 @@ def normalize_edge_input(edges: list[dict]) -> set[tuple[str, str]]:
     return edge_set
 
 
+def tuples_to_edges(edge_tuples) -> list[dict]:
+    """Materialize (from, to) tuples as edge dictionaries.
+
+    Inverse of normalize_edge_input(); used at the boundary where internal
+    tuple edges are handed back to callers.
+
+    Args:
+        edge_tuples: Iterable of (from_module, to_module) tuples, in output order.
+
+    Returns:
+        List of edge dictionaries [{"from": str, "to": str}, ...].
+    """
+    return [{"from": from_module, "to": to_module} for from_module, to_module in edge_tuples]
+
+
 def compare_edges(baseline_edges: list[dict], current_edges: list[dict]) -> dict:
     """Compare baseline edges against current edges.
 
@@ -85,15 +100,10 @@ def compare_edges(baseline_edges: list[dict], current_edges: list[dict]) -> dict
     divergence_set = current_set - baseline_set  # Current - Baseline (added)
     absence_set = baseline_set - current_set  # Baseline - Current (removed)
 
-    # Convert sets back to sorted lists of dicts
-    def set_to_sorted_dicts(edge_set: set[tuple[str, str]]) -> list[dict]:
-        """Convert set of tuples to sorted list of edge dicts."""
-        sorted_tuples = sorted(edge_set, key=lambda t: (t[0], t[1]))
-        return [{"from": f, "to": t} for f, t in sorted_tuples]
-
-    convergence = set_to_sorted_dicts(convergence_set)
-    divergence = set_to_sorted_dicts(divergence_set)
-    absence = set_to_sorted_dicts(absence_set)
+    # Sort partitions (tuples sort lexicographically) and convert to edge dicts
+    convergence = tuples_to_edges(sorted(convergence_set))
+    divergence = tuples_to_edges(sorted(divergence_set))
+    absence = tuples_to_edges(sorted(absence_set))
 
     return {
         "convergence": convergence,
@@ -4,6 +4,10 @@ This module provides functions to detect cycles in module dependency edges
 and compare cycles between old and new edge sets.
 """
 
+import collections
+import functools
+import itertools
+
 from utils.conformance_compare import normalize_edge_input
 
 # Maximum number of cycles to detect before truncating
@@ -13,8 +17,9 @@ MAX_CYCLES = 200
 def canonicalise_cycle(cycle: list[str]) -> tuple[str, ...]:
     """Canonicalise a cycle to a stable representation.
 
-    Rotates the cycle so the lexicographically smallest module is first,
-    then chooses the lexicographically smaller of forward vs reversed.
+    Rotates the cycle to its lexicographically smallest rotation (for a
+    simple cycle, the smallest module first), then chooses the
+    lexicographically smaller of forward vs reversed.
 
     Args:
         cycle: List of module names forming a cycle (without repeating start).
@@ -22,60 +27,302 @@ def canonicalise_cycle(cycle: list[str]) -> tuple[str, ...]:
     Returns:
         Canonical tuple representation of the cycle.
     """
+    return _canonicalise_cycle_cached(tuple(cycle))
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonicalise_cycle_cached(cycle: tuple[str, ...]) -> tuple[str, ...]:
+    """Cached implementation of canonicalise_cycle() on tuple input.
+
+    Cycles recur across old/new graphs in diff_cycles(), so repeated
+    canonicalisation hits the cache.
+    """
     if not cycle:
         return tuple()
 
     if len(cycle) == 1:
         # Self-loop
-        return (cycle[0],)
-
-    # Find index of lexicographically smallest module in forward cycle
-    min_idx = 0
-    min_module = cycle[0]
-    for i, module in enumerate(cycle):
-        if module < min_module:
-            min_module = module
-            min_idx = i
-
-    # Rotate forward so smallest is first
+        return cycle
+
+    # Rotate forward so the lexicographically smallest rotation is first
+    smallest = min(cycle)
+    if cycle.count(smallest) == 1:
+        # Simple cycle: the smallest module is unique, so it starts the
+        # smallest rotation
+        min_idx = cycle.index(smallest)
+        reversed_cycle = cycle[::-1]
+        rev_min_idx = reversed_cycle.index(smallest)
+    else:
+        # Repeated modules: find the least rotation in linear time
+        min_idx = _least_rotation(cycle)
+        reversed_cycle = cycle[::-1]
+        rev_min_idx = _least_rotation(reversed_cycle)
     forward_rotated = cycle[min_idx:] + cycle[:min_idx]
 
-    # Reverse the cycle and find smallest in reversed
-    reversed_cycle = list(reversed(cycle))
-    rev_min_idx = 0
-    rev_min_module = reversed_cycle[0]
-    for i, module in enumerate(reversed_cycle):
-        if module < rev_min_module:
-            rev_min_module = module
-            rev_min_idx = i
-
-    # Rotate reversed so smallest is first
+    # Reverse the cycle and rotate the same way
     reversed_rotated = reversed_cycle[rev_min_idx:] + reversed_cycle[:rev_min_idx]
 
     # Choose lexicographically smaller
-    forward_tuple = tuple(forward_rotated)
-    reversed_tuple = tuple(reversed_rotated)
-    if reversed_tuple < forward_tuple:
-        return reversed_tuple
-    return forward_tuple
+    if reversed_rotated < forward_rotated:
+        return reversed_rotated
+    return forward_rotated
+
+
+def _least_rotation(sequence: tuple[str, ...]) -> int:
+    """Return the start index of the lexicographically smallest rotation.
+
+    Booth's algorithm: a failure-function scan over the doubled sequence,
+    O(n) comparisons instead of comparing all n rotations.
+    """
+    doubled = sequence + sequence
+    failure = [-1] * len(doubled)
+    start = 0
+    for j in range(1, len(doubled)):
+        item = doubled[j]
+        i = failure[j - start - 1]
+        while i != -1 and item != doubled[start + i + 1]:
+            if item < doubled[start + i + 1]:
+                start = j - i - 1
+            i = failure[i]
+        if item != doubled[start + i + 1]:
+            # i == -1 here
+            if item < doubled[start]:
+                start = j
+            failure[j - start] = -1
+        else:
+            failure[j - start] = i + 1
+    return start
+
+
+def _strongly_connected_components(
+    adjacency: dict[str, list[str]], nodes: list[str]
+) -> list[list[str]]:
+    """Find strongly connected components with an iterative Tarjan pass.
+
+    Uses an explicit work stack of (node, neighbor iterator) frames instead of
+    recursion, so deep graphs cannot hit Python's recursion limit.
+
+    Args:
+        adjacency: Mapping of node -> list of successor nodes.
+        nodes: Nodes to visit, in the order roots should be tried.
+
+    Returns:
+        List of components, each a list of node names.
+    """
+    index_of: dict[str, int] = {}
+    lowlink: dict[str, int] = {}
+    on_stack: set[str] = set()
+    scc_stack: list[str] = []
+    components: list[list[str]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index_of:
+            continue
+
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency.get(root, ())))]
+
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index_of:
+                    # Descend into unvisited neighbor
+                    index_of[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    scc_stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(adjacency.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[neighbor])
+            else:
+                # All neighbors explored: finish node
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index_of[node]:
+                    component: list[str] = []
+                    while True:
+                        member = scc_stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
+
+
+def _build_adjacency(edges) -> dict[str, list[str]]:
+    """Build a node -> successors mapping in edge order.
+
+    Every node gets an entry, including nodes that only appear as targets.
+
+    Args:
+        edges: Iterable of (from, to) tuples.
+
+    Returns:
+        Plain dict of node -> list of successor nodes.
+    """
+    adjacency: collections.defaultdict[str, list[str]] = collections.defaultdict(list)
+    for from_module, to_module in edges:
+        adjacency[from_module].append(to_module)
+
+    # Sinks get empty entries so the keys cover all nodes
+    for to_module in {to_module for _, to_module in edges}.difference(adjacency):
+        adjacency[to_module] = []
+
+    return dict(adjacency)
+
+
+def _has_cycle(component: list[str], adjacency: dict[str, list[str]]) -> bool:
+    """Return True if a strongly connected component contains at least one cycle."""
+    return len(component) > 1 or component[0] in adjacency.get(component[0], ())
+
+
+def _unblock(node: str, blocked: set[str], blocked_by: dict[str, set[str]]) -> None:
+    """Johnson's unblock step, done iteratively."""
+    pending = {node}
+    while pending:
+        current = pending.pop()
+        if current in blocked:
+            blocked.remove(current)
+            pending.update(blocked_by[current])
+            blocked_by[current].clear()
+
+
+def _simple_cycles_in_scc(component: list[str], adjacency: dict[str, list[str]]):
+    """Yield the simple cycles of one strongly connected component (Johnson's algorithm).
+
+    Each cycle is yielded as a list of nodes without repeating the start node.
+    After all cycles through the smallest node are found, that node is removed
+    and the remaining subgraph is split into SCCs again.
+
+    Args:
+        component: Nodes of a strongly connected component containing a cycle.
+        adjacency: Mapping of node -> sorted list of successor nodes.
+    """
+    pending_components = [component]
+    while pending_components:
+        members = pending_components.pop()
+        member_set = set(members)
+        subgraph = {
+            node: [n for n in adjacency.get(node, ()) if n in member_set] for node in members
+        }
+        start = min(members)
+
+        path = [start]
+        blocked = {start}
+        closed: set[str] = set()
+        blocked_by: dict[str, set[str]] = {node: set() for node in members}
+        stack = [(start, iter(subgraph[start]))]
+
+        while stack:
+            node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor == start:
+                    yield path[:]
+                    closed.update(path)
+                elif neighbor not in blocked:
+                    path.append(neighbor)
+                    stack.append((neighbor, iter(subgraph[neighbor])))
+                    closed.discard(neighbor)
+                    blocked.add(neighbor)
+                    break
+            else:
+                if node in closed:
+                    _unblock(node, blocked, blocked_by)
+                else:
+                    for neighbor in subgraph[node]:
+                        blocked_by[neighbor].add(node)
+                stack.pop()
+                path.pop()
+
+        # Remove the start node and continue with the remaining cyclic components
+        remaining = {
+            node: [n for n in successors if n != start]
+            for node, successors in subgraph.items()
+            if node != start
+        }
+        for sub_component in _strongly_connected_components(remaining, sorted(remaining)):
+            if _has_cycle(sub_component, remaining):
+                pending_components.append(sub_component)
+
+
+def _is_edge_tuple_list(edges: list) -> bool:
+    """Return True if every edge is already a (from, to) tuple."""
+    return all(isinstance(edge, tuple) for edge in edges)
+
+
+def _normalize_edges(edges: list) -> set[tuple[str, str]]:
+    """Normalize edge dicts (validated) or (from, to) tuples to a set of tuples.
+
+    Raises:
+        ValueError: If an edge dictionary is invalid.
+    """
+    if _is_edge_tuple_list(edges):
+        return set(edges)
+    return normalize_edge_input(edges)
+
+
+def _added_edges_close_no_cycle(old_edges: list, new_edges: list) -> bool:
+    """Return True if new_edges only adds edges to old_edges and none lies on a cycle.
+
+    An added edge (u, v) is on a cycle exactly when u and v share a strongly
+    connected component of the new graph, so one SCC pass decides whether the
+    new graph has the same simple cycles as the old one.
+    """
+    try:
+        old_set = _normalize_edges(old_edges)
+        new_set = _normalize_edges(new_edges)
+    except ValueError:
+        return False
+
+    if not old_set <= new_set:
+        return False
+    added_edges = new_set - old_set
+    if not added_edges:
+        return True
+
+    adjacency = _build_adjacency(new_set)
+    component_of: dict[str, int] = {}
+    for component_id, component in enumerate(
+        _strongly_connected_components(adjacency, list(adjacency))
+    ):
+        for node in component:
+            component_of[node] = component_id
+
+    return all(
+        component_of[from_module] != component_of[to_module]
+        for from_module, to_module in added_edges
+    )
 
 
 def detect_cycles(edges: list[dict], max_cycles: int = MAX_CYCLES) -> dict:
     """Detect cycles in a module dependency graph.
 
+    Finds strongly connected components with an iterative Tarjan pass, then
+    enumerates simple cycles only inside components that contain a cycle.
+
     Args:
-        edges: List of edge dictionaries [{"from": str, "to": str}, ...].
+        edges: List of edge dictionaries [{"from": str, "to": str}, ...], or a
+            list of (from, to) tuples, which skips per-edge validation.
         max_cycles: Maximum number of cycles to detect before truncating (default: 200).
 
     Returns:
         Dictionary containing:
         - cycles: List of cycle lists (each cycle is list of module names)
         - cycles_count: Number of cycles found
-        - truncated: True if max_cycles was reached, False otherwise
+        - truncated: True if more than max_cycles distinct cycles exist, False otherwise
     """
     # Normalize edges to set of tuples
     try:
-        edge_set = normalize_edge_input(edges)
+        edge_set = _normalize_edges(edges)
     except ValueError:
         # Invalid edges - return empty cycles
         return {
@@ -91,82 +338,54 @@ def detect_cycles(edges: list[dict], max_cycles: int = MAX_CYCLES) -> dict:
             "truncated": False,
         }
 
-    # Build adjacency list (sorted neighbors for deterministic traversal)
-    adjacency: dict[str, list[str]] = {}
-    for from_module, to_module in edge_set:
-        if from_module not in adjacency:
-            adjacency[from_module] = []
-        adjacency[from_module].append(to_module)
+    # Repeat calls on the same edge set (diff_cycles, per-commit queries) hit
+    # the cache; fresh lists are built per call so callers can't mutate it
+    cycles, truncated = _detect_cycles_cached(tuple(sorted(edge_set)), max_cycles)
+
+    return {
+        "cycles": [list(cycle) for cycle in cycles],
+        "cycles_count": len(cycles),
+        "truncated": truncated,
+    }
 
-    # Sort neighbors for deterministic traversal
-    for node in adjacency:
-        adjacency[node].sort()
 
-    # Collect all nodes (including those that only appear as targets)
-    all_nodes = set()
-    for from_module, to_module in edge_set:
-        all_nodes.add(from_module)
-        all_nodes.add(to_module)
+@functools.lru_cache(maxsize=64)
+def _detect_cycles_cached(
+    edges: tuple[tuple[str, str], ...], max_cycles: int
+) -> tuple[tuple[tuple[str, ...], ...], bool]:
+    """Cached implementation of detect_cycles() on sorted, deduplicated edge tuples.
 
-    # Detect cycles using DFS
+    Returns:
+        Tuple of (sorted canonical cycles, truncated flag).
+    """
+    # Edges are sorted, so each neighbor list comes out sorted for
+    # deterministic traversal
+    adjacency = _build_adjacency(edges)
+
+    # Only components that contain a cycle need enumeration; order them by
+    # their smallest node for deterministic truncation
+    components = [
+        component
+        for component in _strongly_connected_components(adjacency, sorted(adjacency))
+        if _has_cycle(component, adjacency)
+    ]
+    components.sort(key=min)
+
+    # Stream cycles lazily across components and stop pulling at the cap
+    cycle_stream = itertools.chain.from_iterable(
+        _simple_cycles_in_scc(component, adjacency) for component in components
+    )
     cycles_set: set[tuple[str, ...]] = set()
-    truncated = False
-
-    def dfs_cycles(node: str, path: list[str], visited_complete: set[str]):
-        """DFS helper to detect cycles."""
-        nonlocal truncated
-
-        if truncated:
-            return
-
-        if node in path:
-            # Cycle detected
-            cycle_start_idx = path.index(node)
-            # Extract cycle path without repeating start at end
-            cycle_path = path[cycle_start_idx:]
-            canonical = canonicalise_cycle(cycle_path)
-            cycles_set.add(canonical)
-
-            if len(cycles_set) >= max_cycles:
-                truncated = True
-            return
-
-        if node in visited_complete:
-            # Already explored this node completely
-            return
-
-        # Add to path
-        path.append(node)
-
-        # Visit neighbors
-        if node in adjacency:
-            for neighbor in adjacency[node]:
-                dfs_cycles(neighbor, path, visited_complete)
-                if truncated:
-                    return
-
-        # Remove from path
-        path.pop()
-
-        # Mark as completely visited
-        visited_complete.add(node)
-
-    # Iterate nodes in sorted order for deterministic results
-    visited_complete: set[str] = set()
-    for start_node in sorted(all_nodes):
-        if start_node not in visited_complete:
-            dfs_cycles(start_node, [], visited_complete)
-            if truncated:
-                break
-
-    # Convert canonical tuples back to lists and sort
-    cycles_list = [list(canonical) for canonical in sorted(cycles_set)]
+    for cycle in cycle_stream:
+        cycles_set.add(canonicalise_cycle(cycle))
+        if len(cycles_set) >= max_cycles:
+            break
 
-    return {
-        "cycles": cycles_list,
-        "cycles_count": len(cycles_list),
-        "truncated": truncated,
-    }
+    # Truncated only if at least one more distinct cycle exists past the cap
+    # (reversed duplicates of already-seen cycles don't count)
+    truncated = any(canonicalise_cycle(cycle) not in cycles_set for cycle in cycle_stream)
+
+    return tuple(sorted(cycles_set)), truncated
 
 
 def diff_cycles(
@@ -189,14 +408,18 @@ def diff_cycles(
     """
     # Detect cycles in both sets
     old_result = detect_cycles(old_edges, max_cycles=max_cycles)
-    new_result = detect_cycles(new_edges, max_cycles=max_cycles)
-
     old_cycles = old_result["cycles"]
-    new_cycles = new_result["cycles"]
 
-    # Convert to sets of canonical tuples for comparison
-    old_cycles_set = {canonicalise_cycle(cycle) for cycle in old_cycles}
-    new_cycles_set = {canonicalise_cycle(cycle) for cycle in new_cycles}
+    if not old_result["truncated"] and _added_edges_close_no_cycle(old_edges, new_edges):
+        # Common per-commit case: edges were only added and none closes a
+        # cycle, so the new graph has exactly the old (complete) cycle set
+        new_cycles = [list(cycle) for cycle in old_cycles]
+    else:
+        new_cycles = detect_cycles(new_edges, max_cycles=max_cycles)["cycles"]
+
+    # detect_cycles() already returns canonical cycles, so tuples hash directly
+    old_cycles_set = frozenset(map(tuple, old_cycles))
+    new_cycles_set = frozenset(map(tuple, new_cycles))
 
     # Compute differences
     cycles_added_set = new_cycles_set - old_cycles_set
@@ -6,10 +6,15 @@ both source and target files to modules.
 """
 
 import ast
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
 
 from utils.architecture_config import ArchitectureConfig
 from utils.architecture_mapper import map_path_to_module_id
+from utils.conformance_compare import tuples_to_edges
+from utils.deps_python import iter_import_nodes
 from utils.deps_tsjs import extract_tsjs_import_specifiers
 from utils.ts_import_resolver import resolve_tsjs_import
 from utils.tsconfig_loader import find_tsconfig, load_tsconfig_compiler_options
@@ -30,6 +35,10 @@ IGNORE_DIRS = {
 # Source file extensions to process
 SOURCE_EXTENSIONS = {".py", ".js", ".jsx", ".ts", ".tsx"}
 
+# Byte strings at least one of which every file with imports must contain
+_PYTHON_IMPORT_KEYWORDS = (b"import",)
+_TSJS_IMPORT_KEYWORDS = (b"import", b"require", b"export")
+
 
 def _compute_python_search_roots(repo_root: Path) -> list[Path]:
     """Compute Python import search roots for absolute import resolution.
@@ -82,6 +91,85 @@ def _detect_internal_python_prefixes(repo_root: Path) -> set[str]:
     return prefixes
 
 
+def _walk_source_files(root: Path) -> Iterator[tuple[Path, str, int | None]]:
+    """Yield (path, relative POSIX path, size) for source files under root.
+
+    Walks with os.scandir so directory entries come with their file type and
+    each file is stat'ed exactly once, skipping IGNORE_DIRS. Symlinked
+    directories are followed, except into a directory already on the current
+    walk path (a symlink cycle). Entry paths are all rooted at root, so the
+    relative path is a slice of the entry path. Size is None if the file
+    could not be stat'ed.
+
+    Args:
+        root: Directory to walk.
+    """
+    if root.name in IGNORE_DIRS:
+        return
+
+    root_str = str(root)
+    prefix_len = len(root_str) if root_str.endswith(os.sep) else len(root_str) + 1
+
+    # Each pending directory carries the (device, inode) identities of the
+    # directories on its walk path, so a symlink back into one is skipped
+    root_stat = os.stat(root_str)
+    pending = [(root_str, frozenset({(root_stat.st_dev, root_stat.st_ino)}))]
+    while pending:
+        directory, walk_path_ids = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if entry.name in IGNORE_DIRS:
+                            continue
+                        try:
+                            dir_stat = entry.stat()
+                        except OSError:
+                            continue
+                        dir_id = (dir_stat.st_dev, dir_stat.st_ino)
+                        if dir_id not in walk_path_ids:
+                            pending.append((entry.path, walk_path_ids | {dir_id}))
+                    elif os.path.splitext(entry.name)[1] in SOURCE_EXTENSIONS and entry.is_file():
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = None
+                        rel_path = entry.path[prefix_len:]
+                        if os.sep != "/":
+                            rel_path = rel_path.replace(os.sep, "/")
+                        yield Path(entry.path), rel_path, size
+        except PermissionError:
+            # Skip directories we can't access
+            continue
+
+
+def _read_source_bytes(file_path: Path) -> bytes:
+    """Read a source file in one binary read."""
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+def _decode_source_bytes(raw: bytes) -> str:
+    """Decode source bytes as UTF-8.
+
+    Undecodable bytes are dropped and line endings are normalized to "\n",
+    matching Path.read_text(encoding="utf-8", errors="ignore").
+    """
+    source_text = raw.decode("utf-8", errors="ignore")
+    if "\r" in source_text:
+        source_text = source_text.replace("\r\n", "\n").replace("\r", "\n")
+    return source_text
+
+
+def _lacks_keywords(raw: bytes, keywords: tuple[bytes, ...]) -> bool:
+    """Return True if the decoded text of raw cannot contain any of keywords.
+
+    Only ASCII sources are checked on the bytes: elsewhere a dropped
+    undecodable byte could join the two halves of a keyword.
+    """
+    return raw.isascii() and not any(keyword in raw for keyword in keywords)
+
+
 def resolve_python_absolute_import(
     module_ref: str,
     search_roots: list[Path],
@@ -168,8 +256,8 @@ def _parse_python_import_groups(
     
     groups: list[list[str]] = []
     
-    # Walk the AST to find import nodes
-    for node in ast.walk(tree):
+    # Walk the AST statements to find import nodes
+    for node in iter_import_nodes(tree):
         if isinstance(node, ast.Import):
             # Handle: import a, import a.b, import a as b
             for alias in node.names:
@@ -211,6 +299,51 @@ def _parse_python_import_groups(
     return groups
 
 
+def _scan_source_file(
+    file_path: Path,
+    python_internal_prefixes: set[str],
+) -> list | None:
+    """Read one source file and extract its raw imports.
+
+    Runs on the scan thread pool, so it only touches the file itself; module
+    mapping and import resolution stay on the calling thread.
+
+    Args:
+        file_path: Path to the source file.
+        python_internal_prefixes: Internal Python top-level package prefixes.
+
+    Returns:
+        None if the file could not be read. Otherwise, import groups for
+        Python files (empty if the file does not parse), import specifiers
+        for JS/TS files, or an empty list for other files.
+    """
+    try:
+        raw = _read_source_bytes(file_path)
+    except Exception:
+        return None
+
+    if file_path.suffix == ".py":
+        if _lacks_keywords(raw, _PYTHON_IMPORT_KEYWORDS):
+            # No import statement possible; skip decoding and parsing entirely
+            return []
+        source_text = _decode_source_bytes(raw)
+        if "import" not in source_text:
+            return []
+        try:
+            # Parse Python imports into groups with ordered candidates
+            return _parse_python_import_groups(source_text, python_internal_prefixes)
+        except Exception:
+            # Skip imports if extraction fails
+            return []
+    if file_path.suffix in {".js", ".jsx", ".ts", ".tsx"}:
+        if _lacks_keywords(raw, _TSJS_IMPORT_KEYWORDS):
+            return []
+        return extract_tsjs_import_specifiers(
+            _decode_source_bytes(raw), internal_prefixes=None, include_absolute=True
+        )
+    return []
+
+
 def resolve_python_relative_import(file_path: Path, module_ref: str) -> Path | None:
     """Resolve a Python relative import to a target file path.
 
@@ -358,41 +491,11 @@ def build_dependency_graph(
     python_search_roots = _compute_python_search_roots(repo_root)
     python_internal_prefixes = _detect_internal_python_prefixes(repo_root)
 
-    # Find candidate source files
-    candidate_files: list[Path] = []
-
-    def should_ignore_dir(path: Path) -> bool:
-        """Check if a directory should be ignored."""
-        return path.name in IGNORE_DIRS
-
-    def collect_files(path: Path):
-        """Recursively collect source files."""
-        if should_ignore_dir(path):
-            return
-
-        try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    collect_files(item)
-                elif item.is_file() and item.suffix in SOURCE_EXTENSIONS:
-                    candidate_files.append(item)
-        except PermissionError:
-            # Skip directories we can't access
-            pass
-
-    collect_files(repo_root)
+    # Find candidate source files (with relative paths and sizes)
+    candidate_files = list(_walk_source_files(repo_root))
 
     # Sort by repo-relative POSIX path
-    def get_repo_relative_posix(path: Path) -> str:
-        """Get repo-relative POSIX path string."""
-        try:
-            rel_path = path.relative_to(repo_root)
-            return str(rel_path.as_posix())
-        except ValueError:
-            # Path not relative to repo_root, use full path
-            return str(path.as_posix())
-
-    candidate_files.sort(key=get_repo_relative_posix)
+    candidate_files.sort(key=lambda candidate: candidate[1])
 
     # Apply max_files limit
     files_to_scan = candidate_files[:max_files]
@@ -409,24 +512,33 @@ def build_dependency_graph(
     edges_set: set[tuple[str, str]] = set()
     evidence_list: list[dict] = []
 
-    # Process each file
-    for file_path in files_to_scan:
-        # Get repo-relative path
-        try:
-            rel_path = file_path.relative_to(repo_root)
-            rel_path_str = str(rel_path.as_posix())
-        except ValueError:
-            rel_path_str = str(file_path.as_posix())
+    # Share one string object per repo-relative path across evidence items.
+    # Module ids need no interning: the mapper returns the config's own strings.
+    path_interner: dict[str, str] = {}
 
-        # Read file
-        try:
-            file_size = file_path.stat().st_size
-            if file_size > max_file_bytes:
-                skipped_files += 1
-                continue
+    def intern_path(path_str: str) -> str:
+        """Return the shared string object for a repo-relative path."""
+        return path_interner.setdefault(path_str, path_str)
 
-            source_text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except Exception:
+    def scan_candidate(candidate: tuple[Path, str, int | None]) -> list | None:
+        """Read and parse one candidate, or return None to skip it."""
+        file_path, _, file_size = candidate
+        # Size comes from the walker's stat; None if stat failed
+        if file_size is None or file_size > max_file_bytes:
+            return None
+        return _scan_source_file(file_path, python_internal_prefixes)
+
+    # Read and parse files on a thread pool so disk reads overlap; results
+    # come back in scan order and are resolved and mapped on this thread.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        scan_results = list(executor.map(scan_candidate, files_to_scan))
+
+    # Process each file
+    for (file_path, rel_path, _), scanned_imports in zip(files_to_scan, scan_results):
+        rel_path_str = intern_path(rel_path)
+
+        if scanned_imports is None:
             skipped_files += 1
             continue
 
@@ -457,15 +569,8 @@ def build_dependency_graph(
 
         if file_path.suffix == ".py":
             lang = "py"
-            try:
-                # Parse Python imports into groups with ordered candidates
-                import_groups = _parse_python_import_groups(source_text, python_internal_prefixes)
-            except Exception:
-                # Skip if extraction fails
-                continue
-            
             # Process each import group
-            for group in import_groups:
+            for group in scanned_imports:
                 resolved_path = None
                 # Try candidates in order
                 for import_ref in group:
@@ -488,7 +593,7 @@ def build_dependency_graph(
                 # Map target file to module
                 try:
                     rel_target = resolved_path.relative_to(repo_root)
-                    rel_target_str = str(rel_target.as_posix())
+                    rel_target_str = intern_path(rel_target.as_posix())
                 except ValueError:
                     unresolved_imports += 1
                     continue
@@ -519,12 +624,8 @@ def build_dependency_graph(
         
         elif file_path.suffix in {".js", ".jsx", ".ts", ".tsx"}:
             lang = "tsjs"
-            imports = extract_tsjs_import_specifiers(
-                source_text, internal_prefixes=None, include_absolute=True
-            )
-            
             # Process each import
-            for import_ref in imports:
+            for import_ref in scanned_imports:
                 # Resolve import to target file
                 if import_ref.startswith("."):
                     resolved_path = resolve_tsjs_relative_import(file_path, import_ref)
@@ -546,7 +647,7 @@ def build_dependency_graph(
                 # Map target file to module
                 try:
                     rel_target = resolved_path.relative_to(repo_root)
-                    rel_target_str = str(rel_target.as_posix())
+                    rel_target_str = intern_path(rel_target.as_posix())
                 except ValueError:
                     unresolved_imports += 1
                     continue
@@ -575,8 +676,8 @@ def build_dependency_graph(
                             }
                         )
 
-    # Convert edges to sorted list
-    edges = [{"from": from_mod, "to": to_mod} for from_mod, to_mod in sorted(edges_set)]
+    # Edges are kept as (from, to) tuples internally; convert to sorted dicts
+    edges = tuples_to_edges(sorted(edges_set))
 
     unmapped_buckets = sorted(bucket_counts.items(), key=lambda kv: kv[1], reverse=True)[:10]
     unmapped_bucket_list = [{"bucket": b, "count": c} for b, c in unmapped_buckets]
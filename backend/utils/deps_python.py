@@ -6,6 +6,19 @@ can filter imports based on internal package prefixes.
 """
 
 import ast
+from collections import deque
+from typing import Iterator
+
+from utils.bounded_cache import BoundedCache, text_digest
+
+# Node types that can contain statements; imports are statements, so the
+# import walk never needs to descend into expressions
+_STATEMENT_CONTAINER_TYPES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+# Extraction results by (source digest, prefix set); the same file contents
+# recur across commits in commit-graph analysis
+_EXTRACT_CACHE_SIZE = 4096
+_extract_cache = BoundedCache(_EXTRACT_CACHE_SIZE)
 
 
 def _top_level_name(module: str) -> str:
@@ -31,6 +44,26 @@ def _top_level_name(module: str) -> str:
     return parts[0]
 
 
+def iter_import_nodes(tree: ast.AST) -> Iterator[ast.Import | ast.ImportFrom]:
+    """Yield Import/ImportFrom nodes in ast.walk() order, visiting statements only.
+
+    Args:
+        tree: Parsed module.
+
+    Returns:
+        Iterator over the import nodes of the tree.
+    """
+    pending = deque([tree])
+    while pending:
+        node = pending.popleft()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, _STATEMENT_CONTAINER_TYPES):
+                pending.append(child)
+
+
 def extract_python_import_modules(
     source_text: str,
     *,
@@ -57,6 +90,21 @@ def extract_python_import_modules(
         ValueError: If source_text contains syntax errors. The error message
             includes the line number and error text.
     """
+    prefixes_key = frozenset(internal_prefixes) if internal_prefixes is not None else None
+    cache_key = (text_digest(source_text), prefixes_key)
+    modules = _extract_cache.get(cache_key)
+    if modules is None:
+        # Only successful parses are cached; syntax errors raise every time
+        modules = tuple(_extract_python_import_modules_uncached(source_text, internal_prefixes))
+        _extract_cache.put(cache_key, modules)
+    return list(modules)
+
+
+def _extract_python_import_modules_uncached(
+    source_text: str,
+    internal_prefixes: set[str] | None,
+) -> list[str]:
+    """Parse source_text and extract import modules (see extract_python_import_modules)."""
     # Parse the source code
     try:
         tree = ast.parse(source_text)
@@ -68,8 +116,8 @@ def extract_python_import_modules(
     # Collect all import modules
     modules: set[str] = set()
 
-    # Walk the AST to find import nodes
-    for node in ast.walk(tree):
+    # Walk the AST statements to find import nodes
+    for node in iter_import_nodes(tree):
         if isinstance(node, ast.Import):
             # Handle: import a, import a.b, import a as b
             for alias in node.names:
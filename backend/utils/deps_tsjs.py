@@ -8,13 +8,48 @@ internal prefix filtering.
 
 import re
 
+from utils.bounded_cache import BoundedCache, text_digest
+
+# Import forms, combined into one alternation so a single finditer pass
+# covers them all. Each alternative is wrapped in a lookahead so matches of
+# different forms may overlap; matches of the same form are kept
+# non-overlapping by the scanner, as separate finditer passes would be.
+# - esm: import ... from "spec" or import "spec" (not dynamic import)
+# - export: export ... from "spec"
+# - require: require("spec")
+# - dynamic: import("spec")
+_TSJS_IMPORT_RE = re.compile(
+    r"(?="
+    r"import\s+(?:[^\"'()]*from\s+)?[\"'](?P<esm>[^\"']+)[\"']"
+    r"|export\s+[^\"']*from\s+[\"'](?P<export>[^\"']+)[\"']"
+    r"|require\s*\(\s*[\"'](?P<require>[^\"']+)[\"']\s*\)"
+    r"|import\s*\(\s*[\"'](?P<dynamic>[^\"']+)[\"']\s*\)"
+    r")",
+    re.MULTILINE,
+)
+_DYNAMIC_IMPORT_PREFIX_RE = re.compile(r"import\s*\(")
+
+# Extraction results by (source digest, prefix set, include_absolute); the
+# same file contents recur across commits in commit-graph analysis
+_EXTRACT_CACHE_SIZE = 4096
+_extract_cache = BoundedCache(_EXTRACT_CACHE_SIZE)
+
+# Characters that can leave the normal state of the comment stripper, and
+# the characters that can end (or escape within) each kind of string
+_CODE_SPECIAL_RE = re.compile(r"[/'\"`]")
+_STRING_SPECIAL_RE = {
+    quote: re.compile("[\\\\" + quote + "]") for quote in ("'", '"', "`")
+}
+
 
 def strip_tsjs_comments_preserve_strings(text: str) -> str:
     """Strip comments from JS/TS source while preserving string literals.
 
     Uses a state machine to remove line comments (//) and block comments (/* */)
     while preserving string content in single quotes, double quotes, and
-    template strings.
+    template strings. Each state jumps straight to the next character that can
+    change it (str.find / a precompiled character class), so runs of ordinary
+    code, comment or string text are copied or blanked in one slice.
 
     Args:
         text: JavaScript/TypeScript source code.
@@ -22,83 +57,65 @@ def strip_tsjs_comments_preserve_strings(text: str) -> str:
     Returns:
         Source code with comments removed (replaced with spaces).
     """
-    result = []
+    result: list[str] = []
     i = 0
-    state = "normal"
-
-    while i < len(text):
-        char = text[i]
-        next_char = text[i + 1] if i + 1 < len(text) else ""
-
-        if state == "normal":
-            if char == "/" and next_char == "/":
-                # Start of line comment
-                result.append(" ")
-                i += 1
-                state = "line_comment"
-            elif char == "/" and next_char == "*":
-                # Start of block comment
-                result.append(" ")
-                i += 1
-                state = "block_comment"
-            elif char == "'":
-                result.append(char)
-                state = "single_quote"
-            elif char == '"':
-                result.append(char)
-                state = "double_quote"
-            elif char == "`":
-                result.append(char)
-                state = "template"
+    n = len(text)
+
+    while i < n:
+        # Normal state: copy up to the next comment or string opener
+        match = _CODE_SPECIAL_RE.search(text, i)
+        if match is None:
+            result.append(text[i:])
+            break
+        j = match.start()
+        result.append(text[i:j])
+        char = text[j]
+
+        if char == "/":
+            next_char = text[j + 1 : j + 2]
+            if next_char == "/":
+                # Line comment: "//" becomes one space, the rest of the
+                # line becomes spaces, and the newline is kept
+                end = text.find("\n", j + 2)
+                if end == -1:
+                    end = n
+                result.append(" " * (end - j - 1))
+                i = end
+            elif next_char == "*":
+                # Block comment: "/*" and "*/" become one space each, every
+                # character in between (newlines included) becomes a space
+                end = text.find("*/", j + 2)
+                if end == -1:
+                    result.append(" " * (n - j - 1))
+                    i = n
+                else:
+                    result.append(" " * (end - j))
+                    i = end + 2
             else:
                 result.append(char)
-
-        elif state == "line_comment":
-            if char == "\n":
-                result.append(char)
-                state = "normal"
-            else:
-                result.append(" ")
-
-        elif state == "block_comment":
-            if char == "*" and next_char == "/":
-                result.append(" ")
-                i += 1
-                state = "normal"
-            else:
-                result.append(" ")
-
-        elif state == "single_quote":
-            result.append(char)
-            if char == "\\":
+                i = j + 1
+            continue
+
+        # String literal: copy through the closing quote, skipping escapes
+        string_special = _STRING_SPECIAL_RE[char]
+        k = j + 1
+        while True:
+            match = string_special.search(text, k)
+            if match is None:
+                k = n
+                break
+            k = match.start()
+            if text[k] == "\\":
                 # Escape sequence - skip next char
-                if i + 1 < len(text):
-                    i += 1
-                    result.append(text[i])
-            elif char == "'":
-                state = "normal"
-
-        elif state == "double_quote":
-            result.append(char)
-            if char == "\\":
-                # Escape sequence - skip next char
-                if i + 1 < len(text):
-                    i += 1
-                    result.append(text[i])
-            elif char == '"':
-                state = "normal"
-
-        elif state == "template":
-            result.append(char)
-            if char == "\\":
-                # Escape sequence - skip next char
-                if i + 1 < len(text):
-                    i += 1
-                    result.append(text[i])
-            elif char == "`":
-                state = "normal"
-
-        i += 1
+                k += 2
+                if k >= n:
+                    k = n
+                    break
+            else:
+                k += 1
+                break
+        result.append(text[j:k])
+        i = k
 
     return "".join(result)
 
@@ -168,70 +185,54 @@ def extract_tsjs_import_specifiers(
     Returns:
         Sorted list of unique import specifier strings.
     """
+    # Every import form needs one of these keywords; skip stripping, scanning
+    # and hashing for sources that contain none of them
+    if "import" not in source_text and "require" not in source_text and "export" not in source_text:
+        return []
+
+    prefixes_key = frozenset(internal_prefixes) if internal_prefixes is not None else None
+    cache_key = (text_digest(source_text), prefixes_key, include_absolute)
+    specifiers = _extract_cache.get(cache_key)
+    if specifiers is None:
+        specifiers = tuple(
+            _extract_tsjs_import_specifiers_uncached(
+                source_text, internal_prefixes, include_absolute
+            )
+        )
+        _extract_cache.put(cache_key, specifiers)
+    return list(specifiers)
+
+
+def _extract_tsjs_import_specifiers_uncached(
+    source_text: str,
+    internal_prefixes: set[str] | None,
+    include_absolute: bool,
+) -> list[str]:
+    """Strip comments and scan for import specifiers (see extract_tsjs_import_specifiers)."""
     # Strip comments first
     text = strip_tsjs_comments_preserve_strings(source_text)
 
     # Collect all import specifiers
     specifiers: set[str] = set()
 
-    # Pattern for ESM import (not dynamic import)
-    # Match: import ... from "spec" or import "spec"
-    # Avoid matching: import("spec")
-    esm_pattern = r'import\s+(?:[^"\'()]*from\s+)?["\']([^"\']+)["\']'
-    for match in re.finditer(esm_pattern, text, re.MULTILINE):
-        # Check that this is not a dynamic import
-        # Look backwards to see if there's an opening parenthesis
-        start_pos = match.start()
-        # Check if there's "import(" before this (with optional whitespace)
-        before_text = text[max(0, start_pos - 10) : start_pos]
-        if not re.search(r'import\s*\(', before_text):
-            spec = match.group(1)
-            # Filter by internal_prefixes
-            if spec.startswith("."):
-                # Relative - always include
-                specifiers.add(spec)
-            elif include_absolute:
-                specifiers.add(spec)
-            elif internal_prefixes is not None:
-                top_level = _top_level_specifier(spec)
-                if top_level in internal_prefixes:
-                    specifiers.add(spec)
-                # If internal_prefixes is None, exclude absolute imports
-
-    # Pattern for export-from
-    export_pattern = r'export\s+[^"\']*from\s+["\']([^"\']+)["\']'
-    for match in re.finditer(export_pattern, text, re.MULTILINE):
-        spec = match.group(1)
-        # Filter by internal_prefixes
-        if spec.startswith("."):
-            # Relative - always include
-            specifiers.add(spec)
-        elif include_absolute:
-            specifiers.add(spec)
-        elif internal_prefixes is not None:
-            top_level = _top_level_specifier(spec)
-            if top_level in internal_prefixes:
-                specifiers.add(spec)
-
-    # Pattern for require()
-    require_pattern = r'require\s*\(\s*["\']([^"\']+)["\']\s*\)'
-    for match in re.finditer(require_pattern, text, re.MULTILINE):
-        spec = match.group(1)
-        # Filter by internal_prefixes
-        if spec.startswith("."):
-            # Relative - always include
-            specifiers.add(spec)
-        elif include_absolute:
-            specifiers.add(spec)
-        elif internal_prefixes is not None:
-            top_level = _top_level_specifier(spec)
-            if top_level in internal_prefixes:
-                specifiers.add(spec)
+    # End of the previous match per form; a match starting inside it is one a
+    # separate scan of that form would have stepped over
+    last_end = {"esm": 0, "export": 0, "require": 0, "dynamic": 0}
+
+    for match in _TSJS_IMPORT_RE.finditer(text):
+        form = match.lastgroup
+        if match.start() < last_end[form]:
+            continue
+        last_end[form] = match.end(form)
+        spec = match.group(form)
+        if form == "esm":
+            # Check that this is not a dynamic import
+            # Look backwards to see if there's "import(" before this
+            start_pos = match.start()
+            before_text = text[max(0, start_pos - 10) : start_pos]
+            if _DYNAMIC_IMPORT_PREFIX_RE.search(before_text):
+                continue
 
-    # Pattern for dynamic import()
-    dynamic_pattern = r'import\s*\(\s*["\']([^"\']+)["\']\s*\)'
-    for match in re.finditer(dynamic_pattern, text, re.MULTILINE):
-        spec = match.group(1)
         # Filter by internal_prefixes
         if spec.startswith("."):
             # Relative - always include
@@ -242,6 +243,7 @@ def extract_tsjs_import_specifiers(
             top_level = _top_level_specifier(spec)
             if top_level in internal_prefixes:
                 specifiers.add(spec)
+            # If internal_prefixes is None, exclude absolute imports
 
     # Return sorted, deduplicated list
     return sorted(specifiers)
@@ -4,6 +4,25 @@ This module provides a deterministic drift classifier that uses ONLY conformance
 evidence (edges/rules/cycles) to classify drift, never reading commit message keywords.
 """
 
+from operator import itemgetter
+from typing import NamedTuple
+
+# Count pairs read from the compare, rules and cycles results
+_COMPARE_COUNTS = itemgetter("divergence", "absence")
+_RULES_COUNTS = itemgetter("forbidden_added", "forbidden_removed")
+_CYCLES_COUNTS = itemgetter("cycles_added_count", "cycles_removed_count")
+
+
+class _DriftCounts(NamedTuple):
+    """Conformance change counts that drive drift classification."""
+
+    edges_added: int
+    edges_removed: int
+    forbidden_edges_added: int
+    forbidden_edges_removed: int
+    cycles_added: int
+    cycles_removed: int
+
 
 def classify_drift(analysis: dict) -> dict:
     """Classify drift based on conformance analysis results.
@@ -27,22 +46,20 @@ def classify_drift(analysis: dict) -> dict:
     rules = analysis.get("rules")
     cycles = analysis.get("cycles")
 
-    # Check for errors/missing data
+    # Check for errors/missing data (appended in sorted order)
     reason_codes = []
     if compare is None:
         reason_codes.append("missing_compare")
-    if rules is None:
-        reason_codes.append("missing_rules")
-    elif rules.get("error") is not None:
-        reason_codes.append("missing_rules")
     if cycles is None:
         reason_codes.append("missing_cycles")
+    if rules is None or rules.get("error") is not None:
+        reason_codes.append("missing_rules")
 
     if reason_codes:
         # Unknown classification due to missing data
         return {
             "classification": "unknown",
-            "reason_codes": sorted(reason_codes),
+            "reason_codes": reason_codes,
             "summary": {
                 "edges_added_count": 0,
                 "edges_removed_count": 0,
@@ -53,49 +70,62 @@ def classify_drift(analysis: dict) -> dict:
             },
         }
 
-    # Extract counts with fallbacks
-    compare_counts = compare.get("counts", {})
-    edges_added_count = compare_counts.get(
-        "divergence", len(compare.get("edges_added", []))
-    )
-    edges_removed_count = compare_counts.get(
-        "absence", len(compare.get("edges_removed", []))
+    # Extract counts, falling back to list lengths when a count is absent
+    try:
+        edges_added, edges_removed = _COMPARE_COUNTS(compare["counts"])
+    except (KeyError, TypeError):
+        compare_counts = compare.get("counts") or {}
+        edges_added = compare_counts.get("divergence", len(compare.get("edges_added", [])))
+        edges_removed = compare_counts.get("absence", len(compare.get("edges_removed", [])))
+
+    try:
+        forbidden_added, forbidden_removed = _RULES_COUNTS(rules["counts"])
+    except (KeyError, TypeError):
+        rules_counts = rules.get("counts") or {}
+        forbidden_added = rules_counts.get(
+            "forbidden_added", len(rules.get("forbidden_edges_added", []))
+        )
+        forbidden_removed = rules_counts.get(
+            "forbidden_removed", len(rules.get("forbidden_edges_removed", []))
+        )
+
+    try:
+        cycles_added, cycles_removed = _CYCLES_COUNTS(cycles["counts"])
+    except (KeyError, TypeError):
+        cycles_counts = cycles.get("counts") or {}
+        cycles_added = cycles_counts.get(
+            "cycles_added_count", len(cycles.get("cycles_added", []))
+        )
+        cycles_removed = cycles_counts.get(
+            "cycles_removed_count", len(cycles.get("cycles_removed", []))
+        )
+
+    return _classify_counts(
+        _DriftCounts(
+            edges_added,
+            edges_removed,
+            forbidden_added,
+            forbidden_removed,
+            cycles_added,
+            cycles_removed,
+        )
     )
 
-    rules_counts = rules.get("counts", {})
-    forbidden_edges_added_count = rules_counts.get(
-        "forbidden_added", len(rules.get("forbidden_edges_added", []))
-    )
-    forbidden_edges_removed_count = rules_counts.get(
-        "forbidden_removed", len(rules.get("forbidden_edges_removed", []))
-    )
 
-    cycles_counts = cycles.get("counts", {})
-    cycles_added_count = cycles_counts.get(
-        "cycles_added_count", len(cycles.get("cycles_added", []))
-    )
-    cycles_removed_count = cycles_counts.get(
-        "cycles_removed_count", len(cycles.get("cycles_removed", []))
-    )
+def _classify_counts(counts: _DriftCounts) -> dict:
+    """Classify drift from the counts extracted by classify_drift()."""
+    EA, ER, FA, FR, CA, CR = counts
 
     # Build summary
     summary = {
-        "edges_added_count": edges_added_count,
-        "edges_removed_count": edges_removed_count,
-        "forbidden_edges_added_count": forbidden_edges_added_count,
-        "forbidden_edges_removed_count": forbidden_edges_removed_count,
-        "cycles_added_count": cycles_added_count,
-        "cycles_removed_count": cycles_removed_count,
+        "edges_added_count": EA,
+        "edges_removed_count": ER,
+        "forbidden_edges_added_count": FA,
+        "forbidden_edges_removed_count": FR,
+        "cycles_added_count": CA,
+        "cycles_removed_count": CR,
     }
 
-    # Apply classification rules
-    EA = edges_added_count
-    ER = edges_removed_count
-    FA = forbidden_edges_added_count
-    FR = forbidden_edges_removed_count
-    CA = cycles_added_count
-    CR = cycles_removed_count
-
     # 1. Check for no change
     if EA == 0 and ER == 0 and CA == 0 and CR == 0:
         return {
@@ -107,26 +137,26 @@ def classify_drift(analysis: dict) -> dict:
     # 2. Check for negative (risk-first: forbidden edges added OR cycles added)
     if FA > 0 or CA > 0:
         reason_codes = []
-        if FA > 0:
-            reason_codes.append("forbidden_edges_added")
         if CA > 0:
             reason_codes.append("cycles_added")
+        if FA > 0:
+            reason_codes.append("forbidden_edges_added")
         return {
             "classification": "negative",
-            "reason_codes": sorted(reason_codes),
+            "reason_codes": reason_codes,
             "summary": summary,
         }
 
     # 3. Check for positive (forbidden edges removed OR cycles removed, and no negative)
     if FR > 0 or CR > 0:
         reason_codes = []
-        if FR > 0:
-            reason_codes.append("forbidden_edges_removed")
         if CR > 0:
             reason_codes.append("cycles_removed")
+        if FR > 0:
+            reason_codes.append("forbidden_edges_removed")
         return {
             "classification": "positive",
-            "reason_codes": sorted(reason_codes),
+            "reason_codes": reason_codes,
             "summary": summary,
         }
 
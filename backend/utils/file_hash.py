@@ -0,0 +1,32 @@
+"""File hashing utilities.
+
+This module computes content digests of files on disk without reading
+them into memory in one piece.
+"""
+
+import hashlib
+from pathlib import Path
+
+
+def file_sha256(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file's bytes.
+
+    Args:
+        path: File to hash.
+
+    Returns:
+        Lowercase hex digest of the file content.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        buffer = bytearray(1 << 20)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+        return digest.hexdigest()
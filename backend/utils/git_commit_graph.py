@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
 from typing import Iterable
 
@@ -17,11 +18,25 @@ NULL_TREE_SHA = "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
 
 from utils.architecture_config import ArchitectureConfig
 from utils.architecture_mapper import map_path_to_module_id, normalize_repo_path
+from utils.conformance_compare import tuples_to_edges
 from utils.deps_python import extract_python_import_modules
 from utils.deps_tsjs import extract_tsjs_import_specifiers
+from utils.bounded_cache import BoundedCache
 
 SOURCE_EXTENSIONS = {".py", ".js", ".jsx", ".ts", ".tsx"}
 
+# Import specifiers by (blob id, extension, prefixes, size limit); consecutive
+# commits share most blobs between a commit side and the next parent side
+_BLOB_IMPORTS_CACHE_SIZE = 4096
+_blob_imports_cache = BoundedCache(_BLOB_IMPORTS_CACHE_SIZE)
+
+# Deterministic evidence order; every evidence item carries all of these keys
+_EVIDENCE_SORT_KEY = itemgetter("src_file", "from_module", "to_module", "direction", "import_text")
+
+
+# Leading bytes checked for NULs before the rest of a blob is read
+_BINARY_PEEK_BYTES = 8192
+
 
 @dataclass
 class Limits:
@@ -33,15 +48,25 @@ def _is_binary(data: bytes) -> bool:
     return b"\0" in data
 
 
-def _read_blob_text(tree, path: str, limits: Limits):
-    """Read blob content from a tree respecting size/binary limits."""
-    try:
-        blob = tree / path
-    except Exception:
+def _read_blob_text(blob, limits: Limits):
+    """Read blob content respecting size/binary limits.
+
+    The blob comes straight from the diff entry (its object id is in the raw
+    diff output), so no tree is walked to find it.
+    """
+    if blob is None:
         return None, "missing"
     try:
         stream = blob.data_stream
-        data = stream.read(limits.max_bytes_per_file + 1)
+        # The object header already gives the size; skip oversized blobs
+        # without reading their content
+        if stream.size > limits.max_bytes_per_file:
+            return None, "too_large"
+        # Most binaries show a NUL early; only read the rest of text blobs
+        head = stream.read(_BINARY_PEEK_BYTES)
+        if _is_binary(head):
+            return None, "binary"
+        data = head + stream.read(limits.max_bytes_per_file + 1 - len(head))
     except Exception:
         return None, "read_error"
 
@@ -102,61 +127,93 @@ def _resolve_relative_path(file_path: str, import_spec: str, is_python: bool) ->
         return normalize_repo_path(os.path.normpath(target_path))
 
 
-def _edges_from_text(
-    file_path: str,
-    text: str,
-    config: ArchitectureConfig,
-    prefixes: set[str],
-) -> tuple[set[tuple[str, str]], list[dict]]:
-    """Extract edges and evidence from source text."""
+def _extract_imports(file_path: str, text: str, prefixes: set[str]) -> list[str]:
+    """Extract raw import specifiers from source text (none for other files)."""
     ext = Path(file_path).suffix
+    if ext == ".py":
+        return extract_python_import_modules(text, internal_prefixes=prefixes)
+    if ext in {".js", ".jsx", ".ts", ".tsx"}:
+        return extract_tsjs_import_specifiers(text, internal_prefixes=prefixes)
+    return []
+
+
+def _blob_imports(blob, file_path: str, prefixes: set[str], limits: Limits):
+    """Return (imports, skip_reason) for a blob, cached by blob id.
+
+    A blob id names its content, so the same blob seen again (in the next
+    commit's parent side, or in another analysis run) is neither re-read nor
+    re-parsed. Imports are None when the blob was skipped or is empty. Read
+    and decode errors may be transient, so they are returned uncached.
+    """
+    if blob is None:
+        return None, "missing"
+    key = (
+        blob.binsha,
+        Path(file_path).suffix,
+        frozenset(prefixes),
+        limits.max_bytes_per_file,
+    )
+    cached = _blob_imports_cache.get(key)
+    if cached is not None:
+        imports, reason = cached
+        return (list(imports) if imports is not None else None), reason
+
+    text, reason = _read_blob_text(blob, limits)
+    if reason in ("read_error", "decode_error"):
+        return None, reason
+    imports = _extract_imports(file_path, text, prefixes) if text else None
+    _blob_imports_cache.put(key, (tuple(imports) if imports is not None else None, reason))
+    return imports, reason
+
+
+def _side_imports(blob, file_path: str, config: ArchitectureConfig, prefixes: set[str], limits: Limits):
+    """Return (from_module, imports, skip_reason) for one side of a changed file.
+
+    Only files in a mapped module are parsed, so an unmapped file with
+    unparsable content (e.g. a Python 2 script) cannot fail the delta. Its
+    blob is still read so binary/too-large skips are counted as before.
+    """
     from_module = map_path_to_module_id(file_path, config)
     if from_module == config.unmapped_module_id:
-        return set(), []
+        if blob is None:
+            return from_module, None, "missing"
+        _, reason = _read_blob_text(blob, limits)
+        return from_module, None, reason
+    imports, reason = _blob_imports(blob, file_path, prefixes, limits)
+    return from_module, imports, reason
+
 
+def _edges_from_imports(
+    file_path: str,
+    from_module: str,
+    imports: list[str],
+    config: ArchitectureConfig,
+) -> tuple[set[tuple[str, str]], list[dict]]:
+    """Map a mapped file's import specifiers to module edges and evidence."""
     edges: set[tuple[str, str]] = set()
     evidence: list[dict] = []
+    is_python = Path(file_path).suffix == ".py"
 
-    if ext == ".py":
-        imports = extract_python_import_modules(text, internal_prefixes=prefixes)
-        for imp in imports:
-            if imp.startswith("."):
-                target_path = _resolve_relative_path(file_path, imp, is_python=True)
-            else:
-                target_path = normalize_repo_path(imp.replace(".", "/"))
-            to_module = _map_target_module(target_path, config)
-            if to_module == config.unmapped_module_id:
-                continue
-            edge = (from_module, to_module)
-            edges.add(edge)
-            evidence.append(
-                {
-                    "src_file": normalize_repo_path(file_path),
-                    "import_text": imp,
-                    "from_module": from_module,
-                    "to_module": to_module,
-                }
-            )
-    elif ext in {".js", ".jsx", ".ts", ".tsx"}:
-        imports = extract_tsjs_import_specifiers(text, internal_prefixes=prefixes)
-        for imp in imports:
-            if imp.startswith("."):
-                target_path = _resolve_relative_path(file_path, imp, is_python=False)
-            else:
-                target_path = normalize_repo_path(imp)
-            to_module = _map_target_module(target_path, config)
-            if to_module == config.unmapped_module_id:
-                continue
-            edge = (from_module, to_module)
-            edges.add(edge)
-            evidence.append(
-                {
-                    "src_file": normalize_repo_path(file_path),
-                    "import_text": imp,
-                    "from_module": from_module,
-                    "to_module": to_module,
-                }
-            )
+    for imp in imports:
+        if imp.startswith("."):
+            target_path = _resolve_relative_path(file_path, imp, is_python=is_python)
+        elif is_python:
+            target_path = normalize_repo_path(imp.replace(".", "/"))
+        else:
+            target_path = normalize_repo_path(imp)
+        to_module = _map_target_module(target_path, config)
+        if to_module == config.unmapped_module_id:
+            continue
+        edge = (from_module, to_module)
+        edges.add(edge)
+        evidence.append(
+            {
+                "src_file": normalize_repo_path(file_path),
+                "import_text": imp,
+                "from_module": from_module,
+                "to_module": to_module,
+            }
+        )
 
     return edges, evidence
 
@@ -212,66 +269,61 @@ def build_commit_delta(
 
         stats["changed_files_considered"] += 1
 
-        # Read commit side text if available
-        commit_text = None
+        # Read commit side imports if available; a root commit is diffed
+        # against the empty tree, so its files are on the "a" side
+        commit_imports = None
         if path_commit:
-            text, reason = _read_blob_text(commit.tree, path_commit, limits)
-            if text is None:
-                if reason == "binary":
-                    stats["files_skipped_binary"] += 1
-                elif reason == "too_large":
-                    stats["files_skipped_too_large"] += 1
-            commit_text = text
-
-        parent_text = None
+            commit_blob = d.b_blob if parent is not None else d.a_blob
+            commit_module, commit_imports, reason = _side_imports(
+                commit_blob, path_commit, config, prefixes, limits
+            )
+            if reason == "binary":
+                stats["files_skipped_binary"] += 1
+            elif reason == "too_large":
+                stats["files_skipped_too_large"] += 1
+
+        parent_imports = None
         if parent is not None and path_parent:
-            text, reason = _read_blob_text(parent.tree, path_parent, limits)
-            if text is None:
-                if reason == "binary":
-                    stats["files_skipped_binary"] += 1
-                elif reason == "too_large":
-                    stats["files_skipped_too_large"] += 1
-            parent_text = text
+            parent_module, parent_imports, reason = _side_imports(
+                d.a_blob, path_parent, config, prefixes, limits
+            )
+            if reason == "binary":
+                stats["files_skipped_binary"] += 1
+            elif reason == "too_large":
+                stats["files_skipped_too_large"] += 1
 
         # Extract edges
-        if commit_text:
-            e, ev = _edges_from_text(path_commit, commit_text, config, prefixes)
+        if commit_imports:
+            e, ev = _edges_from_imports(path_commit, commit_module, commit_imports, config)
             edges_commit |= e
             evidence_commit.extend(ev)
-        if parent_text:
-            e, ev = _edges_from_text(path_parent, parent_text, config, prefixes)
+        if parent_imports:
+            e, ev = _edges_from_imports(path_parent, parent_module, parent_imports, config)
             edges_parent |= e
             evidence_parent.extend(ev)
 
-    edges_added = sorted(edges_commit - edges_parent, key=lambda t: (t[0], t[1]))
-    edges_removed = sorted(edges_parent - edges_commit, key=lambda t: (t[0], t[1]))
+    # Edges stay (from, to) tuples until the result is built
+    edges_added = sorted(edges_commit - edges_parent)
+    edges_removed = sorted(edges_parent - edges_commit)
 
     def _evidence_for(edges: list[tuple[str, str]], ev_pool: list[dict], direction: str):
-        out: list[dict] = []
-        for fr, to in edges:
-            for ev in ev_pool:
-                if ev["from_module"] == fr and ev["to_module"] == to:
-                    out.append({**ev, "direction": direction})
-        return out
+        edge_set = set(edges)
+        return [
+            {**ev, "direction": direction}
+            for ev in ev_pool
+            if (ev["from_module"], ev["to_module"]) in edge_set
+        ]
 
     evidence = _evidence_for(edges_added, evidence_commit, "added") + _evidence_for(
         edges_removed, evidence_parent, "removed"
     )
-    evidence.sort(
-        key=lambda e: (
-            e.get("src_file", ""),
-            e.get("from_module", ""),
-            e.get("to_module", ""),
-            e.get("direction", ""),
-            e.get("import_text", ""),
-        )
-    )
+    evidence.sort(key=_EVIDENCE_SORT_KEY)
 
     return {
         "commit": commit.hexsha,
         "parent": parent.hexsha if parent else None,
-        "edges_added": [{"from": fr, "to": to} for fr, to in edges_added],
-        "edges_removed": [{"from": fr, "to": to} for fr, to in edges_removed],
+        "edges_added": tuples_to_edges(edges_added),
+        "edges_removed": tuples_to_edges(edges_removed),
         "edges_added_count": len(edges_added),
         "edges_removed_count": len(edges_removed),
         "evidence": evidence,
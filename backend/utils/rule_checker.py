@@ -6,7 +6,7 @@ and whether any violations are allowed via active baseline exceptions.
 """
 
 from utils.architecture_config import ArchitectureConfig
-from utils.conformance_compare import normalize_edge_input
+from utils.conformance_compare import normalize_edge_input, tuples_to_edges
 
 
 def build_allowed_set_from_rules(config: ArchitectureConfig) -> set[tuple[str, str]]:
@@ -169,8 +169,7 @@ def check_rules(
     # Convert sets back to sorted lists of dicts
     def set_to_sorted_dicts(edge_set: set[tuple[str, str]]) -> list[dict]:
         """Convert set of tuples to sorted list of edge dicts."""
-        sorted_tuples = sorted(edge_set, key=lambda t: (t[0], t[1]))
-        return [{"from": f, "to": t} for f, t in sorted_tuples]
+        return tuples_to_edges(sorted(edge_set))
 
     forbidden_edges_added = set_to_sorted_dicts(forbidden_added_final_set)
     forbidden_edges_removed = set_to_sorted_dicts(forbidden_removed_set)
@@ -178,7 +177,7 @@ def check_rules(
 
     # Build violations list
     violations = []
-    for edge_tuple in sorted(forbidden_added_final_set, key=lambda t: (t[0], t[1])):
+    for edge_tuple in sorted(forbidden_added_final_set):
         violations.append(
             {
                 "type": "forbidden_added",